@@ -13,13 +13,17 @@ Key Highlights:
        b) Using a method to set a new value safely.
        c) Using another method to increment the value by a positive number.
    - Includes error handling to prevent invalid (negative) values.
+   - Declares its attributes in `__slots__`, so each object needs no `__dict__`.
 
 2. User Class with Login Attempts:
    - Adds an attribute 'login_attempts' to track failed or successful login attempts.
    - Provides methods to:
        a) Increment the number of attempts (simulate repeated logins).
        b) Reset the attempts back to zero (simulate successful login or reset).
+   - Keeps the attempts in a shared tracker keyed by email (M4L2_logins.py), which can
+     also tell whether an account is locked out after too many recent attempts.
    - Shows how these methods work with practical examples.
+   - Also declares its attributes in `__slots__`.
 
 Purpose:
 --------
@@ -27,6 +31,8 @@ This file demonstrates how to manage dynamic attributes using methods,
 ensuring data integrity and providing reusable functionality for real-world applications.
 """
 
+from M4L2_logins import login_tracker
+
 # ---------------------------
 # Restaurant Class Definition
 # ---------------------------
@@ -36,6 +42,9 @@ ensuring data integrity and providing reusable functionality for real-world appl
 # - Methods to safely update and increase that count.
 
 class Restaurant:
+    # Fixed attribute slots instead of a per-instance __dict__, to save memory per restaurant
+    __slots__ = ('restaurant_name', 'cuisine_type', 'number_served')
+
     def __init__(self, restaurant_name, cuisine_type):
         self.restaurant_name = restaurant_name
         self.cuisine_type = cuisine_type
@@ -89,13 +98,19 @@ print("\n--- User Class with Login Attempts ---")
 # - Methods to increase attempts and reset them.
 
 class User:
+    # Fixed attribute slots instead of a per-instance __dict__, to save memory per user
+    __slots__ = ('first_name', 'last_name', 'age', 'email', 'location')
+
+    # Login attempts are kept by a shared tracker keyed by email (see M4L2_logins.py),
+    # which also measures the attempt rate and forgets accounts that go idle
+    login_tracker = login_tracker
+
     def __init__(self, first_name, last_name, age, email, location):
         self.first_name = first_name
         self.last_name = last_name
         self.age = age
         self.email = email
         self.location = location
-        self.login_attempts = 0  # Start with zero attempts
 
     def describe_user(self):
         # Displays full details of the user profile
@@ -109,13 +124,27 @@ class User:
         # Prints a friendly greeting to the user
         print(f"Hello, {self.first_name} {self.last_name}! Welcome back!")
 
+    @property
+    def login_attempts(self):
+        # Number of login attempts since the last reset
+        return self.login_tracker.attempts(self.email)
+
+    @login_attempts.setter
+    def login_attempts(self, number):
+        # Direct assignment sets the count in the tracker (0 resets it)
+        self.login_tracker.set_attempts(self.email, number)
+
     def increment_login_attempts(self):
         # Adds 1 to the login attempt count
-        self.login_attempts += 1
+        self.login_tracker.record_attempt(self.email)
 
     def reset_login_attempts(self):
         # Resets the login attempts to zero
-        self.login_attempts = 0
+        self.login_tracker.reset(self.email)
+
+    def is_locked_out(self):
+        # True if there were too many login attempts in the last few minutes
+        return self.login_tracker.is_locked_out(self.email)
 
 
 # Example usage of User class
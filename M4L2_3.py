@@ -17,12 +17,37 @@ Key Features:
    - Includes methods to:
      * Increment the login attempts.
      * Reset the login attempts back to zero.
+   - Login attempts are kept in a shared tracker keyed by email (M4L2_logins.py), which
+     also tells whether an account is locked out after too many recent attempts.
    - Demonstrates encapsulation and safe attribute modification.
 
 3. **Admin Class and Privileges**:
    - Creates an `Admin` class that inherits from `User` and includes a `Privileges` class to manage admin-specific permissions.
    - Demonstrates how composition works by assigning a `Privileges` object inside the `Admin` class.
 
+4. **Compact Storage**:
+   - Every class declares `__slots__`, so its objects carry no per-instance `__dict__`.
+   - `RestaurantRegistry` and `UserRegistry` hold many records as columns: numbers in typed
+     arrays, and repeated text (cuisine type, location, names) stored once per distinct value.
+   - Indexing a registry returns a lightweight view with the usual methods
+     (`describe_restaurant`, `set_number_served`, `describe_user`, ...).
+   - `measure_bytes_per_record` compares the memory used per record by each form.
+
+5. **Thread-Safe Customer Counting**:
+   - `ConcurrentRestaurant` keeps `number_served` in a `ShardedCounter`: each thread adds
+     to its own shard, and the shards are summed when the value is read, so concurrent
+     increments are never lost and threads never wait on each other. A plain `Restaurant`
+     keeps a simple integer, which is smaller but meant for one thread at a time.
+   - `increment_many` adds a whole batch of counts in one update.
+   - `benchmark_number_served` compares increments per second across thread counts.
+
+6. **UserDirectory**:
+   - Finds users and admins by email in O(1), by location or last name in O(1) plus the
+     number of matches, and by age range in O(log n) plus the number of matches, instead of
+     scanning a list.
+   - Keeps its indexes up to date through `add_many`, `update` and `remove`.
+   - `benchmark_user_directory` compares it with linear scans at 1M users.
+
 Purpose:
 --------
 This file helps beginners understand:
@@ -31,11 +56,60 @@ This file helps beginners understand:
 - How inheritance and composition work in Python.
 """
 
+import time
+import random
+import threading
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+
+from M4L2_logins import login_tracker
+
+# ------------------------------------
+# ShardedCounter Class
+# ------------------------------------
+# A counter that many threads can increase at once without losing updates. Each thread
+# adds to its own shard (a one-item list only that thread writes to, found by thread id),
+# and reading the value sums all shards. The lock is shared by all counters and only
+# taken when a thread uses a counter for the first time, never on an ordinary increment.
+# A thread that starts later with the id of a finished thread simply continues its shard.
+class ShardedCounter:
+    __slots__ = ('_base', '_shards')
+    _lock = threading.Lock()
+
+    def __init__(self, value=0):
+        self._base = value
+        self._shards = {}
+
+    # Adds an amount to the calling thread's shard
+    def add(self, amount):
+        shard = self._shards.get(threading.get_ident())
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(threading.get_ident(), [0])
+        shard[0] += amount
+
+    # Returns the current total of all shards
+    def value(self):
+        with self._lock:
+            shards = list(self._shards.values())
+        return self._base + sum(shard[0] for shard in shards)
+
+    # Sets the total. Other threads' shards are left alone; the base is adjusted so the
+    # total equals value at this moment, and increments after it are still counted.
+    def set(self, value):
+        with self._lock:
+            self._base = value - sum(shard[0] for shard in self._shards.values())
+
+
 # ------------------------------------
 # Restaurant Class
 # ------------------------------------
 # Represents a generic restaurant with name, cuisine type, and customer tracking.
 class Restaurant:
+    # Fixed attribute slots instead of a per-instance __dict__, to save memory per restaurant
+    __slots__ = ('restaurant_name', 'cuisine_type', 'number_served')
+
     def __init__(self, restaurant_name, cuisine_type):
         self.restaurant_name = restaurant_name
         self.cuisine_type = cuisine_type
@@ -58,7 +132,45 @@ class Restaurant:
     # Increments the number served by a positive value
     def increment_number_served(self, number):
         if number > 0:
-            self.number_served += number
+            self._add_served(number)
+
+    # Increments the number served by a batch of values in one update, skipping any
+    # value that is not positive
+    def increment_many(self, numbers):
+        total = sum(number for number in numbers if number > 0)
+        if total:
+            self._add_served(total)
+
+    # Adds to the number served; ConcurrentRestaurant replaces this with a thread-safe update
+    def _add_served(self, number):
+        self.number_served += number
+
+
+# ------------------------------------
+# ConcurrentRestaurant Class (Subclass of Restaurant)
+# ------------------------------------
+# A restaurant whose number_served can be updated from many threads at once, for example
+# by several point-of-sale feeds. The count lives in a ShardedCounter, which costs about
+# 100 bytes more per restaurant (and more once threads add shards), so use this class only
+# where the counts really are updated concurrently.
+class ConcurrentRestaurant(Restaurant):
+    __slots__ = ('_served_counter',)
+
+    def __init__(self, restaurant_name, cuisine_type):
+        self._served_counter = ShardedCounter()
+        super().__init__(restaurant_name, cuisine_type)
+
+    # The number of customers served; safe to read and update from several threads
+    @property
+    def number_served(self):
+        return self._served_counter.value()
+
+    @number_served.setter
+    def number_served(self, number):
+        self._served_counter.set(number)
+
+    def _add_served(self, number):
+        self._served_counter.add(number)
 
 
 # ------------------------------------
@@ -66,6 +178,9 @@ class Restaurant:
 # ------------------------------------
 # Represents a specialized restaurant (ice cream stand) with a predefined list of flavors.
 class IceCreamStand(Restaurant):
+    # A subclass needs its own __slots__, or its objects get a __dict__ again
+    __slots__ = ('flavors',)
+
     def __init__(self, restaurant_name, cuisine_type="Ice Cream"):
         super().__init__(restaurant_name, cuisine_type)
         self.flavors = ["Vanilla", "Chocolate", "Strawberry", "Rocky Road", "Cookies and Cream"]
@@ -90,13 +205,18 @@ print("\n--- User and Admin Classes ---")
 # ------------------------------------
 # Represents a system user with personal details and login tracking.
 class User:
+    __slots__ = ('first_name', 'last_name', 'age', 'email', 'location')
+
+    # Login attempts are kept by a shared tracker keyed by email (see M4L2_logins.py),
+    # which also measures the attempt rate and forgets accounts that go idle
+    login_tracker = login_tracker
+
     def __init__(self, first_name, last_name, age, email, location):
         self.first_name = first_name
         self.last_name = last_name
         self.age = age
         self.email = email
         self.location = location
-        self.login_attempts = 0  # Tracks the number of login attempts
 
     # Displays user details
     def describe_user(self):
@@ -109,13 +229,26 @@ class User:
     def greet_user(self):
         print(f"Hello, {self.first_name}!")
 
+    # Number of login attempts since the last reset; assigning sets it in the tracker
+    @property
+    def login_attempts(self):
+        return self.login_tracker.attempts(self.email)
+
+    @login_attempts.setter
+    def login_attempts(self, number):
+        self.login_tracker.set_attempts(self.email, number)
+
     # Increments login attempts by one
     def increment_login_attempts(self):
-        self.login_attempts += 1
+        self.login_tracker.record_attempt(self.email)
 
     # Resets login attempts to zero
     def reset_login_attempts(self):
-        self.login_attempts = 0
+        self.login_tracker.reset(self.email)
+
+    # Returns True if there were too many login attempts in the last few minutes
+    def is_locked_out(self):
+        return self.login_tracker.is_locked_out(self.email)
 
 
 # ------------------------------------
@@ -123,6 +256,8 @@ class User:
 # ------------------------------------
 # Represents a list of privileges for an admin user.
 class Privileges:
+    __slots__ = ('privileges',)
+
     def __init__(self, privileges=None):
         if privileges is None:
             privileges = [
@@ -145,6 +280,8 @@ class Privileges:
 # ------------------------------------
 # Represents an admin user with additional privileges.
 class Admin(User):
+    __slots__ = ('privileges',)
+
     def __init__(self, first_name, last_name, age, email, location):
         super().__init__(first_name, last_name, age, email, location)
         self.privileges = Privileges()  # Composition: Admin has a Privileges object
@@ -153,4 +290,496 @@ class Admin(User):
 # Example usage of Admin
 admin_user = Admin("Hector", "Delatorre", 38, "hector@example.com", "Brownwood, TX")
 admin_user.describe_user()
-admin_user.privileges.show_privileges()
\ No newline at end of file
+admin_user.privileges.show_privileges()
+
+
+# ------------------------------------
+# Compact Storage: Columns
+# ------------------------------------
+# A column of text values that repeat across records (such as a cuisine type or a
+# location). Each distinct value is stored once, and each record keeps only a 4-byte code.
+class CategoryColumn:
+    __slots__ = ('values', 'codes', '_codes_by_value')
+
+    def __init__(self):
+        self.values = []  # Each distinct value, in order of first appearance
+        self.codes = array('I')  # Position in self.values for each record
+        self._codes_by_value = {}
+
+    # Returns the code of a value, adding the value if it is new
+    def code(self, value):
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = self._codes_by_value[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self.code(value))
+
+    def extend(self, values):
+        self.codes.extend(self.code(value) for value in values)
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+    def __setitem__(self, index, value):
+        self.codes[index] = self.code(value)
+
+    def __len__(self):
+        return len(self.codes)
+
+
+# Returns a property that reads and writes one column of a view's registry
+def _column_property(name):
+    def get(view):
+        return view._registry.columns[name][view._index]
+
+    def set(view, value):
+        view._registry.columns[name][view._index] = value
+
+    return property(get, set)
+
+
+# ------------------------------------
+# Compact Storage: Columnar Registry
+# ------------------------------------
+# Stores many records column by column. Each subclass lists its fields as
+# (name, kind, default), where kind is 'category' for repeated text, 'text' for text
+# that is mostly unique (kept in a plain list), or an array typecode for numbers.
+# Indexing the registry returns a view object backed by the columns. Each access builds
+# a new view, so views compare equal (and hash alike) when they show the same record.
+class ColumnarRegistry:
+    fields = ()
+    view_class = None
+
+    def __init__(self):
+        self.columns = {}
+        for name, kind, _ in self.fields:
+            if kind == 'category':
+                self.columns[name] = CategoryColumn()
+            elif kind == 'text':
+                self.columns[name] = []
+            else:
+                self.columns[name] = array(kind)
+
+    # Adds one record and returns its view. Values are given in field order, like the
+    # arguments of the matching class; fields left out get their defaults.
+    def add(self, *values):
+        index = len(self)
+        for position, (name, _, default) in enumerate(self.fields):
+            self.columns[name].append(values[position] if position < len(values) else default)
+        return self[index]
+
+    # Adds many records at once, each given as a tuple of values in field order
+    def extend(self, records):
+        records = list(records)
+        for position, (name, _, default) in enumerate(self.fields):
+            self.columns[name].extend(record[position] if position < len(record) else default
+                                      for record in records)
+
+    def __len__(self):
+        return len(self.columns[self.fields[0][0]])
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("Registry index out of range.")
+        return self.view_class(self, index % len(self))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.view_class(self, index)
+
+
+# Equality and hashing shared by the views: two views are equal when they show the
+# same record of the same registry. It adds no slots, so it can be mixed into a
+# slotted class.
+class RecordView:
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, RecordView):
+            return NotImplemented
+        return self._registry is other._registry and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._registry), self._index))
+
+
+# A Restaurant whose attributes live in a RestaurantRegistry. It inherits every method
+# of Restaurant unchanged; the properties below replace the attribute slots.
+class RestaurantView(RecordView, Restaurant):
+    __slots__ = ('_registry', '_index')
+
+    def __init__(self, registry, index):
+        self._registry = registry
+        self._index = index
+
+    restaurant_name = _column_property('restaurant_name')
+    cuisine_type = _column_property('cuisine_type')
+    number_served = _column_property('number_served')
+
+
+# Holds many restaurants as columns
+class RestaurantRegistry(ColumnarRegistry):
+    fields = (
+        ('restaurant_name', 'text', ''),
+        ('cuisine_type', 'category', ''),
+        ('number_served', 'q', 0),
+    )
+    view_class = RestaurantView
+
+
+# A User whose attributes live in a UserRegistry
+class UserView(RecordView, User):
+    __slots__ = ('_registry', '_index')
+
+    def __init__(self, registry, index):
+        self._registry = registry
+        self._index = index
+
+    first_name = _column_property('first_name')
+    last_name = _column_property('last_name')
+    age = _column_property('age')
+    email = _column_property('email')
+    location = _column_property('location')
+
+
+# Holds many users as columns. First names, last names and locations repeat a lot
+# across users, so they are categories; emails are unique, so they are plain text.
+class UserRegistry(ColumnarRegistry):
+    fields = (
+        ('first_name', 'category', ''),
+        ('last_name', 'category', ''),
+        ('age', 'H', 0),
+        ('email', 'text', ''),
+        ('location', 'category', ''),
+    )
+    view_class = UserView
+
+
+# ------------------------------------
+# UserDirectory Class
+# ------------------------------------
+# A collection of User (or Admin) objects with indexes for fast lookups:
+# - email: a dict from email to user (emails are unique)
+# - location and last name: a dict from each value to the set of users with it
+# - age: a dict from age to the set of users, plus a sorted list of the distinct ages,
+#   so an age range is found with two binary searches
+# Change indexed attributes through update(), not directly, or the indexes go stale.
+class UserDirectory:
+    # Attributes that update() may change
+    fields = ('first_name', 'last_name', 'age', 'email', 'location')
+
+    def __init__(self, users=()):
+        self._by_email = {}
+        self._by_location = {}
+        self._by_last_name = {}
+        self._by_age = {}
+        self._ages = []  # Distinct ages, sorted
+        self.add_many(users)
+
+    # Adds one user; raises ValueError if the email is already taken
+    def add(self, user):
+        if user.email in self._by_email:
+            raise ValueError(f"A user with email {user.email} already exists.")
+        self._by_email[user.email] = user
+        self._by_location.setdefault(user.location, set()).add(user)
+        self._by_last_name.setdefault(user.last_name, set()).add(user)
+        users_of_age = self._by_age.get(user.age)
+        if users_of_age is None:
+            users_of_age = self._by_age[user.age] = set()
+            self._ages.insert(bisect_left(self._ages, user.age), user.age)
+        users_of_age.add(user)
+
+    # Adds many users at once. The sorted list of ages is rebuilt once at the end
+    # instead of being updated for every user.
+    def add_many(self, users):
+        users = list(users)
+        emails = [user.email for user in users]
+        if len(set(emails)) != len(emails) or not self._by_email.keys().isdisjoint(emails):
+            raise ValueError("Emails must be unique across the directory.")
+        for user in users:
+            self._by_email[user.email] = user
+            self._by_location.setdefault(user.location, set()).add(user)
+            self._by_last_name.setdefault(user.last_name, set()).add(user)
+            self._by_age.setdefault(user.age, set()).add(user)
+        self._ages = sorted(self._by_age)
+
+    # Removes a user, given as the object or its email; raises KeyError if not found
+    def remove(self, user):
+        if isinstance(user, str):
+            user = self._by_email[user]
+        elif self._by_email.get(user.email) != user:
+            raise KeyError(user.email)
+        del self._by_email[user.email]
+        self._discard(self._by_location, user.location, user)
+        self._discard(self._by_last_name, user.last_name, user)
+        if self._discard(self._by_age, user.age, user):
+            del self._ages[bisect_left(self._ages, user.age)]
+
+    # Changes attributes of a user in the directory (e.g. update(user, location="Austin, TX"))
+    # and moves it to the right place in every index. If a value cannot be set, the old
+    # values are put back and the user stays in the directory unchanged. A new email
+    # takes the user's login attempts with it, so a lockout survives the change.
+    def update(self, user, **changes):
+        unknown = sorted(set(changes) - set(self.fields))
+        if unknown:
+            raise ValueError(f"Unknown user fields: {unknown}")
+        if self._by_email.get(user.email) != user:
+            raise KeyError(user.email)
+        old_email = user.email
+        new_email = changes.get('email', old_email)
+        if new_email != old_email and new_email in self._by_email:
+            raise ValueError(f"A user with email {new_email} already exists.")
+        
+        old_values = {name: getattr(user, name) for name in changes}
+        self.remove(user)
+        try:
+            for name, value in changes.items():
+                setattr(user, name, value)
+        except Exception:
+            for name, value in old_values.items():
+                setattr(user, name, value)
+            raise
+        finally:
+            self.add(user)
+        if new_email != old_email:
+            user.login_tracker.rename(old_email, new_email)
+
+    # Returns the user with the given email, or None
+    def get(self, email):
+        return self._by_email.get(email)
+
+    # Returns a list of the users in a location
+    def find_by_location(self, location):
+        return list(self._by_location.get(location, ()))
+
+    # Returns a list of the users with a last name
+    def find_by_last_name(self, last_name):
+        return list(self._by_last_name.get(last_name, ()))
+
+    # Returns a list of the users whose age is between min_age and max_age (inclusive)
+    def find_by_age(self, min_age, max_age):
+        ages = self._ages[bisect_left(self._ages, min_age):bisect_right(self._ages, max_age)]
+        return [user for age in ages for user in self._by_age[age]]
+
+    def __len__(self):
+        return len(self._by_email)
+
+    def __contains__(self, email):
+        return email in self._by_email
+
+    def __iter__(self):
+        return iter(self._by_email.values())
+
+    # Removes a user from the set for key in an index, dropping the set once it is empty.
+    # Returns True if the set was dropped.
+    @staticmethod
+    def _discard(index, key, user):
+        users = index[key]
+        users.discard(user)
+        if not users:
+            del index[key]
+            return True
+        return False
+
+
+# ------------------------------------
+# Compact Storage: Memory Measurement
+# ------------------------------------
+# Builds n sample restaurants and n sample users in three forms (plain objects with a
+# __dict__, slotted objects, and a registry) and returns the bytes per record of each,
+# as measured by tracemalloc. Text values are fresh string objects for every record,
+# as they would be when read from a file.
+def measure_bytes_per_record(n=100_000):
+    cuisines = ["Indian", "Italian", "Mexican", "Thai", "Ice Cream", "Diner", "Sushi", "Bakery"]
+    first_names = ["Hector", "Maria", "James", "Aiko", "Omar", "Lena", "Ravi", "Grace"]
+    last_names = ["Delatorre", "Smith", "Nguyen", "Okafor", "Garcia", "Kowalski", "Chen", "Brown"]
+    locations = ["Brownwood, TX", "Austin, TX", "Denver, CO", "Portland, OR", "Boston, MA"]
+
+    def restaurants():
+        return [(f"Restaurant {i}", cuisines[i % len(cuisines)].encode().decode()) for i in range(n)]
+
+    def users():
+        return [(first_names[i % len(first_names)].encode().decode(),
+                 last_names[i // len(first_names) % len(last_names)].encode().decode(),
+                 18 + i % 60, f"user{i}@example.com", locations[i % len(locations)].encode().decode())
+                for i in range(n)]
+
+    # The same classes without __slots__, for comparison
+    class DictRestaurant:
+        __init__ = Restaurant.__init__
+
+    class DictUser:
+        __init__ = User.__init__
+
+    def registry_of(registry_class, records):
+        registry = registry_class()
+        registry.extend(records)
+        return registry
+
+    forms = {
+        'restaurant': {
+            'dict': lambda: [DictRestaurant(*record) for record in restaurants()],
+            'slots': lambda: [Restaurant(*record) for record in restaurants()],
+            'registry': lambda: registry_of(RestaurantRegistry, restaurants()),
+        },
+        'user': {
+            'dict': lambda: [DictUser(*record) for record in users()],
+            'slots': lambda: [User(*record) for record in users()],
+            'registry': lambda: registry_of(UserRegistry, users()),
+        },
+    }
+
+    results = {}
+    for record_type, builders in forms.items():
+        results[record_type] = {}
+        for form, build in builders.items():
+            tracemalloc.start()
+            records = build()
+            results[record_type][form] = tracemalloc.get_traced_memory()[0] / n
+            tracemalloc.stop()
+            del records
+    return results
+
+
+# ------------------------------------
+# Number Served Benchmark
+# ------------------------------------
+# Has each of n_threads threads call increment_number_served(1) on one shared
+# ConcurrentRestaurant (increments in total, split evenly) and returns the increments per
+# second and the final count for each thread count. Two simpler counters are timed the
+# same way for comparison: a plain Restaurant (an unsynchronized integer, which can lose
+# updates) and an integer guarded by a single lock. The last run sends the same counts
+# through increment_many in batches of batch_size.
+def benchmark_number_served(thread_counts=(1, 2, 4, 8), increments=1_000_000, batch_size=100):
+    class LockedRestaurant(Restaurant):
+        __slots__ = ('lock',)
+
+        def __init__(self, restaurant_name, cuisine_type):
+            super().__init__(restaurant_name, cuisine_type)
+            self.lock = threading.Lock()
+
+        def _add_served(self, number):
+            with self.lock:
+                self.number_served += number
+
+    counters = {
+        'unsynchronized': Restaurant,
+        'single lock': LockedRestaurant,
+        'sharded': ConcurrentRestaurant,
+        'sharded, increment_many': ConcurrentRestaurant,
+    }
+    batch = [1] * batch_size
+
+    results = {}
+    for name, make_restaurant in counters.items():
+        results[name] = {}
+        for n_threads in thread_counts:
+            restaurant = make_restaurant("Benchmark Bistro", "Diner")
+            if name == 'sharded, increment_many':
+                per_thread = increments // n_threads // batch_size * batch_size
+
+                def work():
+                    for _ in range(per_thread // batch_size):
+                        restaurant.increment_many(batch)
+            else:
+                per_thread = increments // n_threads
+
+                def work():
+                    for _ in range(per_thread):
+                        restaurant.increment_number_served(1)
+
+            threads = [threading.Thread(target=work) for _ in range(n_threads)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            seconds = time.perf_counter() - start
+
+            results[name][n_threads] = {
+                'increments_per_second': per_thread * n_threads / seconds,
+                'expected': per_thread * n_threads,
+                'counted': restaurant.number_served,
+            }
+    return results
+
+
+# ------------------------------------
+# UserDirectory Benchmark
+# ------------------------------------
+# Builds n_users random users, then times n_queries lookups of each kind (email,
+# location, last name, and an age range) in a UserDirectory and by scanning the list of
+# users. Returns the build time and the average microseconds per query for both.
+def benchmark_user_directory(n_users=1_000_000, n_queries=20, seed=0):
+    rng = random.Random(seed)
+    last_names = [f"Surname{i}" for i in range(5_000)]
+    locations = [f"City {i}, ST" for i in range(2_000)]
+    users = [User("First", rng.choice(last_names), rng.randint(18, 90), f"user{i}@example.com",
+                  rng.choice(locations))
+             for i in range(n_users)]
+
+    start = time.perf_counter()
+    directory = UserDirectory(users)
+    build_seconds = time.perf_counter() - start
+
+    queries = {
+        'email': (lambda: f"user{rng.randrange(n_users)}@example.com",
+                  directory.get,
+                  lambda email: next((user for user in users if user.email == email), None)),
+        'location': (lambda: rng.choice(locations),
+                     directory.find_by_location,
+                     lambda location: [user for user in users if user.location == location]),
+        'last_name': (lambda: rng.choice(last_names),
+                      directory.find_by_last_name,
+                      lambda last_name: [user for user in users if user.last_name == last_name]),
+        'age_range': (lambda: rng.randint(18, 88),
+                      lambda age: directory.find_by_age(age, age + 2),
+                      lambda age: [user for user in users if age <= user.age <= age + 2]),
+    }
+
+    results = {'users': n_users, 'build_seconds': build_seconds, 'queries': {}}
+    for name, (make_query, indexed, scan) in queries.items():
+        timings = {}
+        arguments = [make_query() for _ in range(n_queries)]
+        for method, lookup in (('directory', indexed), ('linear_scan', scan)):
+            start = time.perf_counter()
+            for argument in arguments:
+                lookup(argument)
+            timings[method] = (time.perf_counter() - start) / n_queries * 1e6
+        results['queries'][name] = timings
+    return results
+
+
+if __name__ == "__main__":
+    # Store restaurants in a registry and use them through views
+    restaurants = RestaurantRegistry()
+    restaurants.extend([("Spicy Corner", "Indian"), ("Pasta Place", "Italian"), ("Curry House", "Indian")])
+    cool_cones = restaurants.add("Cool Cones", "Ice Cream")
+    cool_cones.set_number_served(40)
+    cool_cones.increment_number_served(5)
+    cool_cones.describe_restaurant()
+    print(f"Customers served: {cool_cones.number_served}")
+
+    print("\n--- Memory per Record ---")
+    for record_type, forms in measure_bytes_per_record().items():
+        print(f"{record_type}: " + ", ".join(f"{form} {size:.0f} bytes" for form, size in forms.items()))
+
+    print("\n--- Number Served Throughput ---")
+    for name, runs in benchmark_number_served().items():
+        for n_threads, run in runs.items():
+            print(f"{name}, {n_threads} threads: {run['increments_per_second']:,.0f} increments per second, "
+                  f"counted {run['counted']:,} of {run['expected']:,}")
+
+    print("\n--- UserDirectory Lookups ---")
+    directory = UserDirectory([admin_user, User("Maria", "Garcia", 29, "maria@example.com", "Austin, TX")])
+    directory.update(admin_user, location="Austin, TX")
+    print(f"Users in Austin, TX: {[user.email for user in directory.find_by_location('Austin, TX')]}")
+    print(f"Users aged 30 to 40: {[user.email for user in directory.find_by_age(30, 40)]}")
+
+    results = benchmark_user_directory()
+    print(f"Indexed {results['users']:,} users in {results['build_seconds']:.2f} s")
+    for name, timings in results['queries'].items():
+        print(f"{name}: directory {timings['directory']:,.1f} µs, linear scan {timings['linear_scan']:,.1f} µs per query")
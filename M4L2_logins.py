@@ -0,0 +1,230 @@
+"""
+M4L2_logins.py
+
+This Python module tracks login attempts for the User classes in M4L2_2.py and M4L2_3.py,
+keyed by email, so the counts do not depend on keeping every User object in memory.
+
+Key Features:
+-------------
+1. Counts attempts per account in a sliding time window in O(1) per attempt, using two
+   fixed buckets (the current and previous window): the previous bucket is weighted by
+   how much of it still overlaps the sliding window.
+2. Reports whether an account is locked out (too many attempts in the window).
+3. Keeps the total number of attempts since the last reset, which is what
+   `User.login_attempts` returns.
+4. Evicts accounts that have been idle longer than a TTL, oldest first, so memory depends
+   on how many accounts are active, not on how many exist.
+5. Includes a load benchmark that replays millions of attempts against a simulated clock.
+"""
+
+import sys
+import time
+import random
+import threading
+from collections import OrderedDict
+
+# --------------------------
+# Class: Login Attempt Tracker
+# --------------------------
+# Each tracked account has one entry [window, previous, current, total, last_seen]:
+# the index of the current window, the attempt counts of the previous and current
+# windows, the attempts since the last reset, and the time of the last attempt. Entries
+# are kept in order of last attempt, so the idle ones are always at the front.
+class LoginAttemptTracker:
+    def __init__(self, window_seconds=300, max_attempts=5, ttl_seconds=3600, clock=time.monotonic):
+        if window_seconds <= 0:
+            raise ValueError("Window must be a positive number of seconds.")
+        if ttl_seconds < 2 * window_seconds:
+            raise ValueError("TTL must be at least twice the window, or the attempt rate is lost.")
+        self.window_seconds = window_seconds
+        self.max_attempts = max_attempts
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.evicted = 0
+        self._entries = OrderedDict()
+        self._next_eviction = 0
+        self._lock = threading.Lock()
+
+    # Records one attempt for key and returns the attempt rate in the sliding window.
+    # This is the hot path, so the bucket roll and rate are written out inline. The clock
+    # is read inside the lock so entries are always stored in order of last attempt,
+    # which eviction relies on; times passed in as now must likewise never go backwards.
+    def record_attempt(self, key, now=None):
+        entries = self._entries
+        with self._lock:
+            now = self.clock() if now is None else now
+            window, offset = divmod(now, self.window_seconds)
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = [window, 0, 1, 1, now]
+            elif now - entry[4] > self.ttl_seconds:
+                # Expired but not evicted yet: start over, and move it to the end of the order
+                entries.move_to_end(key)
+                entry[:] = [window, 0, 1, 1, now]
+            else:
+                entries.move_to_end(key)
+                if window != entry[0]:
+                    entry[1] = entry[2] if window == entry[0] + 1 else 0
+                    entry[2] = 0
+                    entry[0] = window
+                entry[2] += 1
+                entry[3] += 1
+                entry[4] = now
+            if now >= self._next_eviction:
+                self._evict(now)
+            return entry[1] * (1 - offset / self.window_seconds) + entry[2]
+
+    # Returns the number of attempts for key in the last window_seconds, estimated from the
+    # two buckets
+    def rate(self, key, now=None):
+        now = self.clock() if now is None else now
+        with self._lock:
+            entry = self._live_entry(key, now)
+            if entry is None:
+                return 0.0
+            self._roll(entry, now)
+            return self._rate(entry, now)
+
+    # Returns True if key has reached max_attempts in the sliding window
+    def is_locked_out(self, key, now=None):
+        return self.rate(key, now) >= self.max_attempts
+
+    # Returns the number of attempts for key since it was last reset (or since it was
+    # evicted for being idle)
+    def attempts(self, key, now=None):
+        now = self.clock() if now is None else now
+        with self._lock:
+            entry = self._live_entry(key, now)
+            return 0 if entry is None else entry[3]
+
+    # Forgets all attempts for key
+    def reset(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    # Moves the attempts recorded for key to new_key (when an account's email changes),
+    # replacing any attempts already recorded under new_key. The entry keeps its time of
+    # last attempt but goes to the end of the order; _live_entry still treats it as
+    # expired after the TTL, and it is evicted once the entries in front of it are.
+    def rename(self, key, new_key):
+        if new_key == key:
+            return
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            self._entries.pop(new_key, None)
+            if entry is not None:
+                self._entries[new_key] = entry
+
+    # Sets the number of attempts since the last reset for key, without counting any new
+    # attempts in the sliding window; setting 0 is the same as reset
+    def set_attempts(self, key, total, now=None):
+        if total < 0:
+            raise ValueError("Login attempts cannot be negative.")
+        if total == 0:
+            self.reset(key)
+            return
+        with self._lock:
+            now = self.clock() if now is None else now
+            entry = self._live_entry(key, now)
+            if entry is None:
+                self._entries.pop(key, None)
+                self._entries[key] = [now // self.window_seconds, 0, 0, total, now]
+            else:
+                entry[3] = total
+
+    # Removes every entry idle for longer than the TTL and returns how many were removed
+    def evict_expired(self, now=None):
+        now = self.clock() if now is None else now
+        with self._lock:
+            return self._evict(now)
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Returns the approximate memory held by the tracker's entries, in bytes
+    def nbytes(self):
+        with self._lock:
+            return sys.getsizeof(self._entries) + sum(
+                sys.getsizeof(entry) + sum(sys.getsizeof(value) for value in entry)
+                for entry in self._entries.values())
+
+    # Returns the entry for key, or None if there is none or it has expired
+    def _live_entry(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None or now - entry[4] > self.ttl_seconds:
+            return None
+        return entry
+
+    # Moves an entry's buckets forward to the window containing now
+    def _roll(self, entry, now):
+        window = now // self.window_seconds
+        if window != entry[0]:
+            entry[1] = entry[2] if window == entry[0] + 1 else 0
+            entry[2] = 0
+            entry[0] = window
+
+    # Counts the current window in full and the previous window in proportion to how
+    # much of it is still inside the sliding window ending at now
+    def _rate(self, entry, now):
+        overlap = 1 - (now % self.window_seconds) / self.window_seconds
+        return entry[1] * overlap + entry[2]
+
+    # Removes idle entries from the front of the order, and notes when the oldest
+    # remaining entry will expire so the checks can be skipped until then (an empty
+    # tracker is checked again on the next attempt)
+    def _evict(self, now):
+        removed = 0
+        entries = self._entries
+        self._next_eviction = 0
+        for key, entry in entries.items():
+            if now - entry[4] <= self.ttl_seconds:
+                self._next_eviction = entry[4] + self.ttl_seconds
+                break
+            removed += 1
+        for _ in range(removed):
+            entries.popitem(last=False)
+        self.evicted += removed
+        return removed
+
+# The tracker shared by the User classes
+login_tracker = LoginAttemptTracker()
+
+# --------------------------
+# Function: Benchmark Tracker
+# --------------------------
+# Replays n_attempts login attempts at attempts_per_second (on a simulated clock, so
+# the run is not limited by real time) spread over n_accounts accounts, and returns the
+# real throughput, the number of entries still tracked, the number evicted, and the
+# approximate memory held by the tracker at the end. With the defaults, accounts idle
+# for 30 seconds are evicted, so the tracker stays well below one entry per account.
+def benchmark_tracker(n_accounts=1_000_000, n_attempts=5_000_000, attempts_per_second=20_000,
+                      window_seconds=10, ttl_seconds=30, seed=0):
+    rng = random.Random(seed)
+    emails = [f"user{i}@example.com" for i in range(n_accounts)]
+    keys = [emails[rng.randrange(n_accounts)] for _ in range(n_attempts)]
+
+    tracker = LoginAttemptTracker(window_seconds, ttl_seconds=ttl_seconds)
+    locked_out = 0
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        if tracker.record_attempt(key, i / attempts_per_second) >= tracker.max_attempts:
+            locked_out += 1
+    seconds = time.perf_counter() - start
+
+    return {
+        'attempts': n_attempts,
+        'simulated_seconds': n_attempts / attempts_per_second,
+        'attempts_per_second': n_attempts / seconds,
+        'locked_out_attempts': locked_out,
+        'tracked_accounts': len(tracker),
+        'evicted_accounts': tracker.evicted,
+        'tracker_megabytes': tracker.nbytes() / 1e6,
+    }
+
+if __name__ == "__main__":
+    results = benchmark_tracker()
+    print(f"Replayed {results['attempts']:,} attempts ({results['simulated_seconds']:,.0f} simulated seconds) "
+          f"at {results['attempts_per_second']:,.0f} attempts per second")
+    print(f"Locked-out attempts: {results['locked_out_attempts']:,}")
+    print(f"Accounts tracked: {results['tracked_accounts']:,}, evicted: {results['evicted_accounts']:,}")
+    print(f"Tracker memory: {results['tracker_megabytes']:,.1f} MB")
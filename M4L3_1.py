@@ -5,22 +5,150 @@ This Python file demonstrates how to create a simple class that simulates rollin
 
 - The Die class represents a die with a customizable number of sides (default is 6).
 - The roll_die method prints a random number between 1 and the number of sides, simulating a die roll.
+- The roll_many method rolls the die many times at once and returns the results as a compact
+  numpy array, optionally with a count of how often each face came up.
+- Each die has its own random number generator, which can be seeded to repeat a simulation.
+- A die can be weighted (non-uniform) by giving a probability weight for each face.
+- sum_distribution computes the exact probability of every total for many dice by
+  multiplying their probability polynomials with the FFT; monte_carlo_sum_distribution
+  estimates the same table by simulation in parallel processes, for checking the result.
 - The code creates a 6-sided die and rolls it 10 times, printing the result of each roll.
 
 This example helps beginners understand how to use classes and random number generation in Python.
 """
-import random
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 class Die:
-    def __init__(self, sides=6):
+    def __init__(self, sides=6, seed=None, weights=None):
         self.sides = sides
+        # Optional relative weight for each face 1..sides; None means a fair die
+        self.weights = None if weights is None else list(weights)
+        if self.weights is not None and len(self.weights) != sides:
+            raise ValueError("A weighted die needs one weight per side.")
+        # An independent generator per die; the same seed always gives the same rolls
+        self.rng = np.random.default_rng(seed)
+
+    # Returns the probability of each face 1..sides
+    def probabilities(self):
+        if self.weights is None:
+            return np.full(self.sides, 1 / self.sides)
+        weights = np.asarray(self.weights, dtype=np.float64)
+        return weights / weights.sum()
+
+    # Returns a single roll as a Python int
+    def roll(self):
+        return int(self.roll_many(1)[0])
 
+    # Prints a single roll
     def roll_die(self):
-        print(random.randint(1, self.sides))
+        print(self.roll())
+
+    # Returns n rolls in the smallest unsigned integer type that holds every face
+    # (uint8 for up to 255 sides). With counts=True, also returns how many times each
+    # face 1..sides came up.
+    def roll_many(self, n, counts=False):
+        rolls = _roll_faces(self.rng, self.sides, None if self.weights is None else self.probabilities(), n)
+        if counts:
+            return rolls, np.bincount(rolls, minlength=self.sides + 1)[1:]
+        return rolls
+
+    # Counts how many times each face comes up in n rolls without keeping the rolls,
+    # generating them chunk_size at a time so memory stays constant for any n
+    def roll_counts(self, n, chunk_size=10_000_000):
+        counts = np.zeros(self.sides, dtype=np.int64)
+        for start in range(0, n, chunk_size):
+            counts += self.roll_many(min(chunk_size, n - start), counts=True)[1]
+        return counts
+
+# Rolls n faces of a die with the given number of sides, uniformly or with the given
+# face probabilities, as the smallest unsigned integer type that holds every face
+def _roll_faces(rng, sides, probabilities, n):
+    dtype = np.min_scalar_type(sides)
+    if probabilities is None:
+        return rng.integers(1, sides + 1, size=n, dtype=dtype)
+    return (rng.choice(sides, size=n, p=probabilities) + 1).astype(dtype)
+
+# ------------------------------------
+# Exact Sum Distribution
+# ------------------------------------
+# The probabilities of one die are the coefficients of a polynomial (p1*x + p2*x² + ...),
+# and the distribution of a sum of dice is the product of their polynomials. The product
+# is computed with the FFT, and identical dice are raised to a power instead of being
+# multiplied one by one, so hundreds of dice take milliseconds. Probabilities below
+# about 1e-16 are at the level of floating-point noise and are reported as 0.
+# Returns (totals, probabilities) as two numpy arrays.
+def sum_distribution(dice):
+    min_total = len(dice)
+    max_total = sum(die.sides for die in dice)
+    size = 1 << (max_total - min_total).bit_length()
+
+    groups = {}
+    for die in dice:
+        key = tuple(die.probabilities())
+        groups[key] = groups.get(key, 0) + 1
+
+    spectrum = np.ones(size // 2 + 1, dtype=np.complex128)
+    for probabilities, count in groups.items():
+        spectrum *= np.fft.rfft(probabilities, size) ** count
+
+    probabilities = np.fft.irfft(spectrum, size)[:max_total - min_total + 1]
+    probabilities = np.clip(probabilities, 0, None)
+    probabilities[probabilities < 1e-16] = 0
+    return np.arange(min_total, max_total + 1), probabilities / probabilities.sum()
+
+# ------------------------------------
+# Monte Carlo Sum Distribution
+# ------------------------------------
+# Estimates the same table by rolling all the dice n_rolls times. The work is split
+# across worker processes, each with its own statistically independent seed spawned
+# from one SeedSequence, so a given seed reproduces the same estimate.
+# Returns (totals, probabilities) in the same format as sum_distribution.
+def monte_carlo_sum_distribution(dice, n_rolls, workers=None, seed=None, chunk_size=1_000_000):
+    workers = workers or os.cpu_count() or 1
+    specs = [(die.sides, None if die.weights is None else die.probabilities()) for die in dice]
+    shares = [n_rolls // workers + (1 if i < n_rolls % workers else 0) for i in range(workers)]
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = sum(pool.map(_simulate_sum_counts, [specs] * workers, shares, seeds,
+                              [chunk_size] * workers))
+
+    min_total = len(dice)
+    return np.arange(min_total, min_total + len(counts)), counts / n_rolls
+
+# Counts how often each total (from len(specs) upwards) comes up in n rolls of all dice
+def _simulate_sum_counts(specs, n, seed, chunk_size):
+    rng = np.random.default_rng(seed)
+    min_total = len(specs)
+    counts = np.zeros(sum(sides for sides, _ in specs) - min_total + 1, dtype=np.int64)
+
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        totals = np.zeros(size, dtype=np.int64)
+        for sides, probabilities in specs:
+            totals += _roll_faces(rng, sides, probabilities, size)
+        counts += np.bincount(totals - min_total, minlength=len(counts))
+    return counts
+
+if __name__ == "__main__":
+    # Create a 6-sided die
+    my_die = Die()
+
+    # Roll the die 10 times
+    for _ in range(10):
+        my_die.roll_die()
 
-# Create a 6-sided die
-my_die = Die()
+    # Roll the die a million times at once and count each face
+    rolls, counts = my_die.roll_many(1_000_000, counts=True)
+    print(f"Face counts for {len(rolls):,} rolls: {counts.tolist()}")
 
-# Roll the die 10 times
-for _ in range(10):
-    my_die.roll_die()
+    # Exact and simulated distribution of the sum of two 6-sided dice and one 10-sided die
+    dice = [Die(6), Die(6), Die(10)]
+    totals, exact = sum_distribution(dice)
+    _, simulated = monte_carlo_sum_distribution(dice, 1_000_000, seed=42)
+    print("Total  Exact   Simulated")
+    for total, p_exact, p_simulated in zip(totals, exact, simulated):
+        print(f"{total:5d}  {p_exact:.4f}  {p_simulated:.4f}")
@@ -6,18 +6,221 @@ This Python file demonstrates how to randomly select items from a list to simula
 - The code creates a list containing 10 numbers and 5 letters.
 - It randomly selects 4 unique items from the list to form a winning ticket.
 - The winning ticket is printed, and any ticket matching these items wins a prize.
+- It then simulates a million random tickets against the winning ticket to estimate the odds:
+  each ticket is stored as a 15-bit mask (one bit per item), so the items two tickets share
+  are found with a single bitwise AND, and counting the set bits gives the number of matches.
+- verify_ticket_file checks a file of submitted tickets (one per line, e.g. "3,10,A,R")
+  against the winning ticket. Every ticket has a rank from 0 to 1364 (its position among
+  all possible tickets), so a whole file reduces to 1365 counters and one table lookup.
 
 This example helps beginners understand how to use lists and random sampling in Python.
 """
 
+import os
+import time
 import random
+import tempfile
+from collections import Counter
+from itertools import combinations
+from math import comb
+
+import numpy as np
 
 # Create a list with 10 numbers and 5 letters
 items = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 'A', 'H', 'C', 'P', 'R']
 
+# Number of items on each ticket
+TICKET_SIZE = 4
+
+# ------------------------------------
+# Bitmask Ticket Encoding
+# ------------------------------------
+# Item i of the list is bit i of the mask, so a ticket fits in a 16-bit integer.
+ITEM_BITS = {item: 1 << i for i, item in enumerate(items)}
+
+# Converts a ticket (a list of items) to its bitmask
+def ticket_to_mask(ticket):
+    mask = 0
+    for item in ticket:
+        mask |= ITEM_BITS[item]
+    return mask
+
+# Converts a bitmask back to the list of items it contains
+def mask_to_ticket(mask):
+    return [item for item, bit in ITEM_BITS.items() if mask & bit]
+
+# Every possible ticket (C(15, 4) = 1365 of them) as a bitmask, in increasing order, so
+# the position of a mask in this array is the rank of the ticket (see ticket_rank)
+ALL_TICKET_MASKS = np.sort(np.array([ticket_to_mask(ticket) for ticket in combinations(items, TICKET_SIZE)],
+                                    dtype=np.uint16))
+
+# Rank of every 15-bit mask that is a valid ticket, -1 for every other mask
+MASK_TO_RANK = np.full(1 << len(items), -1, dtype=np.int16)
+MASK_TO_RANK[ALL_TICKET_MASKS] = np.arange(len(ALL_TICKET_MASKS))
+
+# Combinatorial ranking: with the ticket's item positions sorted as c1 < c2 < c3 < c4,
+# rank = C(c1, 1) + C(c2, 2) + C(c3, 3) + C(c4, 4). This numbers all 1365 tickets
+# 0..1364 without gaps, in the same order as ALL_TICKET_MASKS.
+def ticket_rank(ticket):
+    positions = sorted(ITEM_BITS[item].bit_length() - 1 for item in ticket)
+    return sum(comb(position, k) for k, position in enumerate(positions, start=1))
+
+# Returns the ticket with the given rank
+def rank_to_ticket(rank):
+    return mask_to_ticket(int(ALL_TICKET_MASKS[rank]))
+
+# Number of set bits for every 15-bit value, used as a vectorized popcount
+POPCOUNT = np.array([bin(mask).count('1') for mask in range(1 << len(items))], dtype=np.uint8)
+
+# ------------------------------------
+# Lottery Simulation
+# ------------------------------------
+# Returns the exact probability that a random ticket matches 0, 1, 2, 3 or 4 items
+# of a winning ticket, by checking all 1365 possible tickets
+def match_probabilities(winning_ticket):
+    matches = POPCOUNT[ALL_TICKET_MASKS & ticket_to_mask(winning_ticket)]
+    return np.bincount(matches, minlength=TICKET_SIZE + 1) / len(ALL_TICKET_MASKS)
+
+# Generates n random tickets as bitmasks. Picking uniformly among all possible tickets
+# gives the same distribution as random.sample(items, 4).
+def random_ticket_masks(n, rng):
+    return ALL_TICKET_MASKS[rng.integers(0, len(ALL_TICKET_MASKS), size=n)]
+
+# Draws n_tickets random tickets in batches and counts how many match 0..4 items of the
+# winning ticket. Returns the counts together with the throughput in tickets per second.
+def simulate_lottery(winning_ticket, n_tickets, batch_size=10_000_000, seed=None):
+    rng = np.random.default_rng(seed)
+    winning_mask = np.uint16(ticket_to_mask(winning_ticket))
+    match_counts = np.zeros(TICKET_SIZE + 1, dtype=np.int64)
+
+    start = time.perf_counter()
+    for batch_start in range(0, n_tickets, batch_size):
+        masks = random_ticket_masks(min(batch_size, n_tickets - batch_start), rng)
+        match_counts += np.bincount(POPCOUNT[masks & winning_mask], minlength=TICKET_SIZE + 1)
+    seconds = time.perf_counter() - start
+
+    return {
+        'tickets': n_tickets,
+        'match_counts': match_counts.tolist(),
+        'exact_matches': int(match_counts[TICKET_SIZE]),
+        'partial_matches': int(match_counts[1:TICKET_SIZE].sum()),
+        'seconds': seconds,
+        'tickets_per_second': n_tickets / seconds if seconds else float('inf'),
+    }
+
+# ------------------------------------
+# Ticket File Verification
+# ------------------------------------
+# Bit of each item as it is written in a ticket file, e.g. b'10' or b'A'
+TOKEN_BITS = {str(item).encode(): bit for item, bit in ITEM_BITS.items()}
+
+# Returns the rank of one line of a ticket file, or -1 if the line is not 4 distinct items
+def parse_ticket_line(line):
+    tokens = line.split(b',')
+    if len(tokens) != TICKET_SIZE:
+        return -1
+    mask = 0
+    for token in tokens:
+        bit = TOKEN_BITS.get(token.strip())
+        if bit is None:
+            return -1
+        mask |= bit
+    return int(MASK_TO_RANK[mask])
+
+# Checks every ticket in a file against the winning ticket in one pass. The file is read
+# in blocks of block_size bytes and each block is split into lines and counted with
+# Counter, which runs in C; only distinct lines are parsed (there are at most 1365 tickets
+# times 24 item orders), and their ranks are cached for the whole file. The number of
+# matches for each rank comes from a table built once from the winning ticket.
+# Returns the 0..4 match counts, the line numbers (from 1) of the winning tickets, the
+# number of invalid lines and the throughput.
+def verify_ticket_file(path, winning_ticket, block_size=1024 * 1024):
+    matches_by_rank = POPCOUNT[ALL_TICKET_MASKS & ticket_to_mask(winning_ticket)]
+    winning_rank = ticket_rank(winning_ticket)
+    rank_counts = np.zeros(len(ALL_TICKET_MASKS), dtype=np.int64)
+    line_ranks = {}
+    winners = []
+    invalid = 0
+    line_number = 0
+    size = os.path.getsize(path)
+
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        remainder = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                lines = [remainder] if remainder.strip() else []
+            else:
+                block = remainder + block
+                end = block.rfind(b'\n') + 1
+                lines, remainder = block[:end].split(b'\n')[:-1], block[end:]
+
+            for line, count in Counter(lines).items():
+                rank = line_ranks.get(line)
+                if rank is None:
+                    rank = line_ranks[line] = parse_ticket_line(line)
+                if rank < 0:
+                    invalid += count if line.strip() else 0
+                    continue
+                rank_counts[rank] += count
+                if rank == winning_rank:
+                    index = -1
+                    for _ in range(count):
+                        index = lines.index(line, index + 1)
+                        winners.append(line_number + index + 1)
+
+            line_number += len(lines)
+            if not block:
+                break
+    seconds = time.perf_counter() - start
+
+    match_counts = np.bincount(matches_by_rank, weights=rank_counts, minlength=TICKET_SIZE + 1).astype(np.int64)
+    tickets = int(rank_counts.sum())
+    return {
+        'tickets': tickets,
+        'match_counts': match_counts.tolist(),
+        'exact_matches': int(match_counts[TICKET_SIZE]),
+        'partial_matches': int(match_counts[1:TICKET_SIZE].sum()),
+        'winners': sorted(winners),
+        'invalid_lines': invalid,
+        'seconds': seconds,
+        'tickets_per_second': tickets / seconds if seconds else float('inf'),
+        'megabytes_per_second': size / 1e6 / seconds if seconds else float('inf'),
+    }
+
+# Writes n_tickets random tickets to a file, one per line, for testing the verifier
+def write_ticket_file(path, n_tickets, seed=None, batch_size=1_000_000):
+    rng = np.random.default_rng(seed)
+    lines = np.array([','.join(str(item) for item in rank_to_ticket(rank)) + '\n'
+                      for rank in range(len(ALL_TICKET_MASKS))], dtype=object)
+    with open(path, 'w') as f:
+        for batch_start in range(0, n_tickets, batch_size):
+            ranks = rng.integers(0, len(ALL_TICKET_MASKS), size=min(batch_size, n_tickets - batch_start))
+            f.write(''.join(lines[ranks]))
+    return path
+
 # Randomly select 4 unique items from the list
-winning_ticket = random.sample(items, 4)
+winning_ticket = random.sample(items, TICKET_SIZE)
 
 # Print the winning ticket message
 print("Any ticket matching these 4 numbers or letters wins a prize:")
 print(winning_ticket)
+
+if __name__ == "__main__":
+    # Simulate one million random tickets against the winning ticket
+    results = simulate_lottery(winning_ticket, 1_000_000)
+    print(f"\nSimulated {results['tickets']:,} tickets "
+          f"({results['tickets_per_second']:,.0f} tickets per second):")
+    for matched, count in enumerate(results['match_counts']):
+        print(f"  {matched} items matched: {count:,} tickets")
+    print(f"Exact odds of winning: 1 in {len(ALL_TICKET_MASKS):,}")
+
+    # Write a file of one million submitted tickets and check it against the winning ticket
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_ticket_file(os.path.join(directory, 'tickets.txt'), 1_000_000)
+        results = verify_ticket_file(path, winning_ticket)
+    print(f"\nVerified {results['tickets']:,} submitted tickets "
+          f"({results['megabytes_per_second']:,.0f} MB per second):")
+    print(f"  Winning tickets: {results['exact_matches']:,} (first lines: {results['winners'][:5]})")
+    print(f"  Partial matches: {results['partial_matches']:,}")
@@ -1,7 +1,7 @@
 """
 Assessment 4: Visualizing Cubic Numbers with Matplotlib
 
-This Python script demonstrates how to use **data visualization** to understand mathematical patterns.  
+This Python script demonstrates how to use **data visualization** to understand mathematical patterns.
 It uses the **matplotlib** library to plot cubic numbers (x³) as scatter plots.
 
 1. **Plotting the first 5 cubic numbers**:
@@ -17,6 +17,13 @@ It uses the **matplotlib** library to plot cubic numbers (x³) as scatter plots.
        - Using a different color map (`plasma`) for variety.
        - Adjusting marker size for readability (smaller points for large sets).
 
+3. **Plotting millions of cubic numbers (or any power)**:
+   - Generates the numbers in numpy chunks with M4L4_sequences, which switches from
+     int64 to floats at the exact overflow boundary instead of silently wrapping around.
+   - Above `raster_threshold` points, switches to a density-binned raster: the points
+     are counted into pixel-sized bins chunk by chunk and drawn as one image, so render
+     time and memory stay roughly flat however many points there are.
+
 This file helps beginners learn:
 - How to calculate cubic numbers in Python.
 - How to create scatter plots with color mapping using Matplotlib.
@@ -24,32 +31,78 @@ This file helps beginners learn:
 
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
 
-# First 5 cubic numbers
-x_small = list(range(1, 6))
-y_small = [x**3 for x in x_small]
-
-plt.figure(figsize=(6, 4))
-plt.scatter(x_small, y_small, c=y_small, cmap='viridis', s=100)
-plt.title("First 5 Cubic Numbers")
-plt.xlabel("Number")
-plt.ylabel("Cube")
-plt.colorbar(label='Cubic Value')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# First 5000 cubic numbers
-x_large = list(range(1, 5001))
-y_large = [x**3 for x in x_large]
-
-plt.figure(figsize=(10, 6))
-plt.scatter(x_large, y_large, c=y_large, cmap='plasma', s=1)
-plt.title("First 5000 Cubic Numbers")
-plt.xlabel("Number")
-plt.ylabel("Cube")
-plt.colorbar(label='Cubic Value')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+from M4L4_sequences import power_chunks, power_range
+
+# --------------------------
+# Function: Bin Powers
+# --------------------------
+# Counts the points (x, x**exponent) for x = start .. stop-1 into a grid of
+# width × height pixel bins and keeps the mean value of each bin for coloring. The
+# points come from power_chunks one chunk at a time, so memory depends on the chunk
+# size and grid, not on the number of points. An empty range gives an all-masked grid
+# over a unit extent.
+def bin_powers(start, stop, exponent, width, height, chunk_size=1_000_000):
+    if stop <= start:
+        return np.ma.masked_all((height, width)), (start, start + 1, 0.0, 1.0)
+    y_min, y_max = (float(value) for value in power_range(start, stop, exponent))
+    y_span = (y_max - y_min) or 1.0
+    counts = np.zeros(width * height)
+    sums = np.zeros(width * height)
+
+    for x, y in power_chunks(start, stop, exponent, chunk_size, overflow='float'):
+        y = y.astype(np.float64)
+        columns = np.minimum((x - start) * width // (stop - start), width - 1)
+        rows = np.minimum(((y - y_min) / y_span * height).astype(np.int64), height - 1)
+        bins = columns * height + rows
+        counts += np.bincount(bins, minlength=width * height)
+        sums += np.bincount(bins, weights=y, minlength=width * height)
+
+    with np.errstate(invalid='ignore'):
+        mean_values = (sums / counts).reshape(width, height)
+    return np.ma.masked_invalid(mean_values).T, (start, stop - 1, y_min, y_max)
+
+# --------------------------
+# Function: Plot Powers
+# --------------------------
+# Plots (x, x**exponent) for x = start .. stop-1 colored by the value. Small sequences
+# are drawn as a scatter plot; above raster_threshold points, the binned image from
+# bin_powers is drawn instead, with one bin per pixel of the figure by default.
+# An empty range is drawn as an empty (all-masked) image.
+def plot_powers(start, stop, exponent, title, cmap='viridis', marker_size=1, figsize=(10, 6),
+                raster_threshold=100_000, resolution=None):
+    figure = plt.figure(figsize=figsize)
+
+    if 0 < stop - start <= raster_threshold:
+        chunks = list(power_chunks(start, stop, exponent, overflow='float'))
+        x = np.concatenate([x for x, _ in chunks])
+        y = np.concatenate([y.astype(np.float64) for _, y in chunks])
+        plt.scatter(x, y, c=y, cmap=cmap, s=marker_size)
+    else:
+        width, height = resolution or (int(figsize[0] * figure.dpi), int(figsize[1] * figure.dpi))
+        image, extent = bin_powers(start, stop, exponent, width, height)
+        plt.imshow(image, cmap=cmap, origin='lower', aspect='auto', extent=extent)
+
+    plt.title(title)
+    plt.xlabel("Number")
+    plt.ylabel("Power" if exponent != 3 else "Cube")
+    plt.colorbar(label='Cubic Value' if exponent == 3 else 'Value')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+# --------------------------
+# Function: Plot Cubic Numbers
+# --------------------------
+# Plots the first n cubic numbers (x³ for x = 1..n).
+def plot_cubic_numbers(n, title, **options):
+    plot_powers(1, n + 1, 3, title, **options)
+
+if __name__ == "__main__":
+    # First 5 cubic numbers
+    plot_cubic_numbers(5, "First 5 Cubic Numbers", cmap='viridis', marker_size=100, figsize=(6, 4))
+
+    # First 5000 cubic numbers
+    plot_cubic_numbers(5000, "First 5000 Cubic Numbers", cmap='plasma', marker_size=1, figsize=(10, 6))
@@ -0,0 +1,106 @@
+"""
+M4L4_sequences.py
+
+This Python module generates power sequences (x, x**exponent) for the plots in M4L4.py,
+quickly and without silent overflow.
+
+Key Features:
+-------------
+1. Computes the powers with numpy in fixed-size chunks, so any range can be processed
+   with bounded memory.
+2. Finds the exact overflow boundary for 64-bit integers: the largest |x| whose power
+   still fits (for cubes that is 2,097,151). Chunks are split at that boundary.
+3. Past the boundary, switches to one of three modes:
+   - 'float': 64-bit floats (fast, rounded above 2**53, infinite past about 1.8e308)
+   - 'exact': Python big integers (exact at any size, but slower)
+   - 'error': raise OverflowError
+4. Streams the chunks to a plotter (as a generator) or to a CSV file on disk.
+
+Why this matters:
+-----------------
+numpy's int64 arithmetic wraps around on overflow without any warning, so
+`np.arange(1, 3_000_000) ** 3` returns wrong, even negative, cubes at the end.
+"""
+
+import numpy as np
+
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+# --------------------------
+# Function: Int64 Power Limit
+# --------------------------
+# Returns the largest x >= 0 with x**exponent <= INT64_MAX, using exact integer
+# arithmetic (a float root alone can be off by one near the boundary).
+def int64_power_limit(exponent):
+    if exponent < 0:
+        raise ValueError("Exponent must be a non-negative integer.")
+    if exponent <= 1:
+        return INT64_MAX
+
+    limit = int(round(INT64_MAX ** (1 / exponent)))
+    while limit ** exponent > INT64_MAX:
+        limit -= 1
+    while (limit + 1) ** exponent <= INT64_MAX:
+        limit += 1
+    return limit
+
+# --------------------------
+# Function: Power Chunks
+# --------------------------
+# Yields (x, y) array pairs with y = x**exponent for x = start .. stop-1, at most
+# chunk_size values at a time. Inside the safe range [-limit, limit] y is exact int64;
+# outside it, y follows the overflow mode. No chunk mixes the two. An empty range
+# (stop <= start) yields nothing.
+def power_chunks(start, stop, exponent, chunk_size=1_000_000, overflow='float'):
+    if overflow not in ('float', 'exact', 'error'):
+        raise ValueError("Overflow mode must be 'float', 'exact' or 'error'.")
+    if stop <= start:
+        return
+
+    limit = int64_power_limit(exponent)
+    boundaries = sorted({start, stop} | {b for b in (-limit, limit + 1) if start < b < stop})
+
+    for segment_start, segment_stop in zip(boundaries, boundaries[1:]):
+        safe = -limit <= segment_start and segment_stop - 1 <= limit
+        if not safe and overflow == 'error':
+            raise OverflowError(f"x**{exponent} does not fit in int64 for |x| > {limit:,}.")
+
+        for chunk_start in range(segment_start, segment_stop, chunk_size):
+            x = np.arange(chunk_start, min(chunk_start + chunk_size, segment_stop), dtype=np.int64)
+            if safe:
+                yield x, x ** exponent
+            elif overflow == 'float':
+                yield x, x.astype(np.float64) ** exponent
+            else:
+                yield x, x.astype(object) ** exponent
+
+# --------------------------
+# Function: Power Range
+# --------------------------
+# Returns the smallest and largest value of x**exponent over x = start .. stop-1 as
+# exact Python integers. The extremes of a power are always at an end of the range
+# or at zero, so no values need to be generated. Returns None for an empty range.
+def power_range(start, stop, exponent):
+    if stop <= start:
+        return None
+    candidates = [start, stop - 1] + ([0] if start <= 0 < stop else [])
+    values = [x ** exponent for x in candidates]
+    return min(values), max(values)
+
+# --------------------------
+# Function: Save Power Sequence
+# --------------------------
+# Streams the sequence to a CSV file ("x,y" per line) chunk by chunk, so sequences far
+# larger than memory can be written. Returns the number of rows written.
+def save_power_sequence(path, start, stop, exponent, chunk_size=1_000_000, overflow='exact'):
+    rows = 0
+    with open(path, 'w') as f:
+        f.write("x,y\n")
+        for x, y in power_chunks(start, stop, exponent, chunk_size, overflow):
+            if y.dtype == object:
+                f.write(''.join(f"{a},{b}\n" for a, b in zip(x.tolist(), y.tolist())))
+            else:
+                np.savetxt(f, np.column_stack((x, y)), fmt=['%d', '%d' if y.dtype.kind == 'i' else '%.17g'],
+                           delimiter=',')
+            rows += len(x)
+    return rows
@@ -6,87 +6,619 @@ pandas, matplotlib, seaborn, and numpy.
 
 Key Features:
 -------------
-1. Loads a CSV dataset with fire data by country, year, and land cover type.
-2. Summarizes fire activity by country, year, and land cover category.
+1. Loads a CSV dataset with fire data by country, year, and land cover type,
+   keeping a columnar .npy cache so the CSV is only parsed once, or streams
+   files larger than memory in chunks, or aggregates byte ranges on several cores.
+2. Summarizes fire activity by country, year, and land cover category in a single aggregation pass
+   into a country×year×land cover cube that answers top-N, range and slice queries directly,
+   and can save those totals and update them one new year at a time.
 3. Creates visualizations:
    - Bar chart of top countries by burned area.
    - Heatmap of fire activity by land cover type for top countries.
    - A simulated global map showing fire intensity.
-4. Prints summary statistics for reporting and saves charts as PNG files.
+4. Prints summary statistics for reporting and saves charts as PNG files, optionally
+   rendering them headlessly in parallel worker processes.
 5. Handles errors for missing files and unexpected issues.
+6. Can keep finished summaries and charts in a content-addressed result cache, so
+   rerunning on an unchanged file skips the work entirely.
+7. Can read and group the data with a multi-threaded engine (pyarrow or polars) when one
+   is installed, falling back to pandas otherwise.
+8. Offers a command-line interface with a fast summary-only mode (text or JSON) that
+   never imports the plotting libraries.
 
 The purpose is to demonstrate real-world data analysis using Python with clear outputs and visual insights.
 """
 
-# Importing necessary libraries for data manipulation, visualization, and numerical computations
+# Importing necessary libraries for data manipulation and numerical computations.
+# The plotting libraries (matplotlib and seaborn) are imported inside the chart
+# functions, so a summary-only run never pays for loading them.
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tracemalloc
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from matplotlib.patches import Rectangle
 import warnings
 # Suppress unnecessary warning messages for cleaner output
 warnings.filterwarnings('ignore')
 
+# Burned-area columns (km²) for each land cover type in the MCD64A1 dataset
+FIRE_COLUMNS = ['forest', 'savannas', 'shrublands_grasslands', 'croplands', 'other']
+
+# --------------------------
+# Function: Read Fire CSV
+# --------------------------
+# This function is the typed loading schema shared by every reader. It only parses
+# the columns the analysis uses, stores countries as a categorical, years as a small
+# nullable integer (a blank year stays missing), and burned areas with a configurable
+# float width ('float32' halves them).
+def read_fire_csv(csv_file_path, float_dtype='float64', categorical_country=True, **kwargs):
+    """
+    Read the country, year and land cover columns with compact dtypes
+    """
+    dtypes = {'year': 'Int16'}
+    dtypes.update({column: float_dtype for column in FIRE_COLUMNS})
+    if categorical_country:
+        dtypes['country'] = 'category'
+    
+    return pd.read_csv(csv_file_path, usecols=['country', 'year'] + FIRE_COLUMNS,
+                       dtype=dtypes, **kwargs)
+
 # --------------------------
 # Function: Load and Process Fire Data
 # --------------------------
 # This function reads the fire data from a CSV file, displays basic dataset information
 # such as number of rows, columns, years covered, and unique countries.
-def load_and_process_fire_data(csv_file_path):
+# With use_cache=True the CSV is parsed only once and later runs load the columnar cache.
+# It also reports the process memory before and after loading.
+def load_and_process_fire_data(csv_file_path, use_cache=False, cache_dir=None, float_dtype='float64'):
     print("Loading fire data...")
+    memory_before = _resident_memory_mb()
     
-    df = pd.read_csv(csv_file_path)
+    if use_cache:
+        df = load_fire_data_cached(csv_file_path, cache_dir, float_dtype=float_dtype)
+    else:
+        df = read_fire_csv(csv_file_path, float_dtype)
+    
+    memory_after = _resident_memory_mb()
     
     print(f"Dataset loaded successfully!")
     print(f"Shape: {df.shape}")
+    print(f"Dataframe memory: {df.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+    if memory_before is not None:
+        print(f"Process memory: {memory_before:.1f} MB before load, {memory_after:.1f} MB after load")
     print(f"Years covered: {df['year'].min()} - {df['year'].max()}")
     print(f"Countries: {df['country'].nunique()}")
     
     return df
 
+def _resident_memory_mb():
+    # Current resident set size from /proc (Linux); None where that is unavailable
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError, AttributeError):
+        return None
+
+# --------------------------
+# Function: Load Fire Data from Columnar Cache
+# --------------------------
+# This function keeps a binary copy of the CSV as one .npy file per column, which
+# numpy can memory-map without any parsing. Text columns are stored as integer codes
+# plus a table of unique values. The cache is rebuilt whenever the CSV's size or
+# modification time changes (or its content hash, with validate='hash'), or when a
+# different float width is requested.
+def load_fire_data_cached(csv_file_path, cache_dir=None, validate='stat', float_dtype='float64'):
+    """
+    Load the fire data from a per-column .npy cache, building it on first use
+    """
+    if cache_dir is None:
+        cache_dir = csv_file_path + '.cache'
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    
+    fingerprint = _file_fingerprint(csv_file_path, content_hash=(validate == 'hash'))
+    
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if (meta.get('float_dtype') == float_dtype
+                and all(meta['source'].get(key) == value for key, value in fingerprint.items())):
+            print("Using columnar cache...")
+            return _read_column_cache(cache_dir, meta['columns'])
+    
+    print("Building columnar cache...")
+    df = read_fire_csv(csv_file_path, float_dtype)
+    _write_column_cache(df, cache_dir, _file_fingerprint(csv_file_path, content_hash=True), float_dtype)
+    return df
+
+def _file_fingerprint(path, content_hash=False):
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if content_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        fingerprint['sha256'] = digest.hexdigest()
+    return fingerprint
+
+def _write_column_cache(df, cache_dir, fingerprint, float_dtype):
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    columns = []
+    for i, column in enumerate(df.columns):
+        values = df[column]
+        if values.dtype == object or isinstance(values.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            codes, categories = pd.factorize(values, sort=True)
+            np.save(os.path.join(cache_dir, f'{i}.codes.npy'), codes)
+            np.save(os.path.join(cache_dir, f'{i}.categories.npy'), np.asarray(categories, dtype=str))
+            columns.append({'name': column, 'kind': 'categorical'})
+        elif isinstance(values.array, pd.arrays.IntegerArray):
+            # Nullable integers are stored as the values plus a mask of the missing ones
+            np.save(os.path.join(cache_dir, f'{i}.npy'), values.to_numpy(values.dtype.numpy_dtype, na_value=0))
+            np.save(os.path.join(cache_dir, f'{i}.mask.npy'), values.isna().to_numpy())
+            columns.append({'name': column, 'kind': 'nullable'})
+        else:
+            np.save(os.path.join(cache_dir, f'{i}.npy'), values.to_numpy())
+            columns.append({'name': column, 'kind': 'numeric'})
+    
+    # The metadata is written last so a half-written cache is never used
+    with open(os.path.join(cache_dir, 'meta.json'), 'w') as f:
+        json.dump({'source': fingerprint, 'float_dtype': float_dtype, 'columns': columns}, f)
+
+def _read_column_cache(cache_dir, columns):
+    data = {}
+    for i, column in enumerate(columns):
+        if column['kind'] == 'categorical':
+            codes = np.load(os.path.join(cache_dir, f'{i}.codes.npy'), mmap_mode='r')
+            categories = np.load(os.path.join(cache_dir, f'{i}.categories.npy'))
+            data[column['name']] = pd.Categorical.from_codes(codes, categories)
+        elif column['kind'] == 'nullable':
+            data[column['name']] = pd.arrays.IntegerArray(
+                np.load(os.path.join(cache_dir, f'{i}.npy'), mmap_mode='r'),
+                np.load(os.path.join(cache_dir, f'{i}.mask.npy'), mmap_mode='r'))
+        else:
+            data[column['name']] = np.load(os.path.join(cache_dir, f'{i}.npy'), mmap_mode='r')
+    # copy=False keeps the numeric columns backed by the memory-mapped files
+    return pd.DataFrame(data, copy=False)
+
+# --------------------------
+# Function: Aggregate Fire Data
+# --------------------------
+# This function scans the dataframe once, grouping by country and year, and builds
+# a FireCube from that small result. Every summary (country, year and land cover
+# totals) and every plot takes its input from the cube instead of the raw rows.
+# Rows with a missing country or year are kept (dropna=False), as the cube still
+# counts them in the totals they belong to.
+def aggregate_fire_data(df):
+    """
+    Build the country×year×land cover cube in a single pass
+    """
+    country_year = df.groupby(['country', 'year'], observed=True, dropna=False)[FIRE_COLUMNS].sum()
+    return FireCube.from_country_year(country_year)
+
+# --------------------------
+# Function: Stream Fire Aggregates
+# --------------------------
+# This function reads the CSV in bounded chunks and folds each chunk into a running
+# country×year table, so peak memory depends on the chunk size and the number of
+# countries and years rather than on the size of the file.
+def stream_fire_aggregates(csv_file_path, chunksize=1_000_000):
+    """
+    Build the fire cube from a CSV too large to load in one piece
+    """
+    print("Streaming fire data...")
+    
+    country_year = None
+    rows = 0
+    for chunk in read_fire_csv(csv_file_path, categorical_country=False, chunksize=chunksize):
+        partial = chunk.groupby(['country', 'year'], dropna=False)[FIRE_COLUMNS].sum()
+        country_year = merge_country_year(country_year, partial)
+        rows += len(chunk)
+    
+    print(f"Streamed {rows:,} rows successfully!")
+    return FireCube.from_country_year(country_year)
+
+# --------------------------
+# Function: Parallel Fire Aggregates
+# --------------------------
+# This function splits the CSV into byte ranges that start and end on line boundaries,
+# parses and aggregates each range in a separate process, and merges the partial
+# country×year tables. It assumes no quoted field contains a newline.
+def parallel_fire_aggregates(csv_file_path, workers=None):
+    """
+    Build the fire cube using a pool of worker processes
+    """
+    workers = workers or os.cpu_count() or 1
+    print(f"Aggregating fire data with {workers} workers...")
+    
+    ranges = _split_csv_byte_ranges(csv_file_path, workers)
+    
+    country_year = None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_stop_memory_tracing) as pool:
+        partials = pool.map(_aggregate_byte_range,
+                            [csv_file_path] * len(ranges),
+                            [start for start, end in ranges],
+                            [end for start, end in ranges])
+        for partial in partials:
+            country_year = merge_country_year(country_year, partial)
+    
+    return FireCube.from_country_year(country_year)
+
+# --------------------------
+# Function: Check Parallel Aggregates
+# --------------------------
+# This function runs the serial and parallel paths on the same file and confirms
+# that both cubes have the same labels and the same values (up to rounding).
+def check_parallel_aggregates(csv_file_path, workers=None):
+    """
+    Verify that parallel aggregation matches the serial result
+    """
+    serial = aggregate_fire_data(read_fire_csv(csv_file_path))
+    parallel = parallel_fire_aggregates(csv_file_path, workers)
+    
+    return _cubes_match(serial, parallel)
+
+def _cubes_match(first, second):
+    return (np.array_equal(first.countries, second.countries)
+            and np.array_equal(first.years, second.years)
+            and np.allclose(first.values, second.values, rtol=1e-9, atol=0))
+
+def _split_csv_byte_ranges(csv_file_path, parts):
+    size = os.path.getsize(csv_file_path)
+    with open(csv_file_path, 'rb') as f:
+        f.readline()
+        offsets = [f.tell()]
+        for i in range(1, parts):
+            f.seek(max(offsets[-1], offsets[0] + (size - offsets[0]) * i // parts))
+            f.readline()
+            offsets.append(f.tell())
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets, offsets[1:]) if end > start]
+
+def _aggregate_byte_range(csv_file_path, start, end):
+    with open(csv_file_path, 'rb') as f:
+        header = f.readline()
+        f.seek(start)
+        body = f.read(end - start)
+    chunk = read_fire_csv(io.BytesIO(header + body), categorical_country=False)
+    return chunk.groupby(['country', 'year'], dropna=False)[FIRE_COLUMNS].sum()
+
+# --------------------------
+# Dataframe Backends
+# --------------------------
+# Each backend reads the CSV and returns the country×year table as a pandas frame
+# indexed by (country, year), which is all the FireCube needs. pyarrow and polars
+# parse and group on several threads; they are optional and only imported when used.
+# Every backend keeps the rows with a missing country or year as missing keys.
+def _pandas_country_year(csv_file_path):
+    df = read_fire_csv(csv_file_path)
+    return df.groupby(['country', 'year'], observed=True, dropna=False)[FIRE_COLUMNS].sum()
+
+def _pyarrow_country_year(csv_file_path):
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    column_types = {'country': pa.string(), 'year': pa.int16()}
+    column_types.update({column: pa.float64() for column in FIRE_COLUMNS})
+    # strings_can_be_null reads a blank country as missing, as pandas and polars do
+    table = pa_csv.read_csv(csv_file_path, convert_options=pa_csv.ConvertOptions(
+        include_columns=['country', 'year'] + FIRE_COLUMNS, column_types=column_types,
+        strings_can_be_null=True))
+    
+    grouped = table.group_by(['country', 'year']).aggregate([(column, 'sum') for column in FIRE_COLUMNS])
+    country_year = grouped.to_pandas().set_index(['country', 'year'])
+    return country_year.rename(columns=lambda column: column.removesuffix('_sum'))[FIRE_COLUMNS]
+
+def _polars_country_year(csv_file_path):
+    import polars as pl
+    
+    schema = {'country': pl.Utf8, 'year': pl.Int16}
+    schema.update({column: pl.Float64 for column in FIRE_COLUMNS})
+    grouped = (pl.scan_csv(csv_file_path, schema_overrides=schema)
+               .group_by(['country', 'year'])
+               .agg([pl.col(column).sum() for column in FIRE_COLUMNS])
+               .collect())
+    return grouped.to_pandas().set_index(['country', 'year'])[FIRE_COLUMNS]
+
+# Backends in order of preference for backend='auto'
+FRAME_BACKENDS = {
+    'polars': _polars_country_year,
+    'pyarrow': _pyarrow_country_year,
+    'pandas': _pandas_country_year,
+}
+
+# --------------------------
+# Function: Aggregate Fire CSV
+# --------------------------
+# This function builds the fire cube straight from the CSV with the chosen backend.
+# 'auto' uses the first installed multi-threaded engine, and any backend that is not
+# installed falls back to pandas, so the results are the same whichever engine runs.
+def aggregate_fire_csv(csv_file_path, backend='auto'):
+    """
+    Build the fire cube from a CSV using the pandas, pyarrow or polars backend
+    """
+    names = list(FRAME_BACKENDS) if backend == 'auto' else [backend, 'pandas']
+    for name in names:
+        try:
+            country_year = FRAME_BACKENDS[name](csv_file_path)
+        except ImportError:
+            print(f"Backend '{name}' is not installed, trying the next one...")
+            continue
+        print(f"Aggregated fire data with the {name} backend")
+        return FireCube.from_country_year(country_year)
+
+# --------------------------
+# Function: Check Backend Aggregates
+# --------------------------
+# This function confirms that a backend produces the same cube as pandas.
+def check_backend_aggregates(csv_file_path, backend):
+    """
+    Verify that a backend's result matches the pandas result
+    """
+    return _cubes_match(aggregate_fire_csv(csv_file_path, 'pandas'), aggregate_fire_csv(csv_file_path, backend))
+
+# --------------------------
+# Function: Merge Country×Year Totals
+# --------------------------
+# This function adds two partial country×year tables together. Pairs that appear
+# in only one of them keep their value, and the result stays sorted by country and year.
+def merge_country_year(total, partial):
+    """
+    Add a partial country×year table into a running total
+    """
+    if total is None:
+        return partial
+    return total.add(partial, fill_value=0).sort_index()
+
+# --------------------------
+# Function: Save and Load Fire State
+# --------------------------
+# The persisted state is the country×year table of burned area; the cube and every
+# summary are derived from it. It is small (countries × years rows), so a plain CSV is used.
+# It is written to a .partial file first and then renamed over the old one, so an
+# interrupted save never leaves a truncated state behind.
+def save_fire_state(cube, state_path):
+    """
+    Save the country×year totals so later runs can update them incrementally
+    """
+    partial_path = state_path + '.partial'
+    cube.country_year_frame().to_csv(partial_path)
+    os.replace(partial_path, state_path)
+
+def load_fire_state(state_path):
+    """
+    Rebuild the fire cube from a saved country×year state file
+    """
+    return FireCube.from_country_year(_read_fire_state(state_path))
+
+def _read_fire_state(state_path):
+    # Blank keys are the rows with a missing country or year
+    return pd.read_csv(state_path, index_col=['country', 'year'], dtype={'year': 'Int16'})
+
+# --------------------------
+# Function: Append Fire Year
+# --------------------------
+# This function reads only the new rows (usually one new year of data), adds their
+# country×year totals to the saved state and writes it back. Years that are already
+# in the state are rejected so the same data cannot be counted twice.
+def append_fire_year(state_path, new_csv_path):
+    """
+    Add new rows to the saved state and return the updated fire cube
+    """
+    print(f"Appending {new_csv_path} to {state_path}...")
+    
+    country_year = _read_fire_state(state_path)
+    new_rows = read_fire_csv(new_csv_path, categorical_country=False)
+    new_years = set(new_rows['year'].dropna().astype(int))
+    
+    repeated_years = new_years & set(country_year.index.get_level_values('year').dropna())
+    if repeated_years:
+        raise ValueError(f"Years already in the saved state: {sorted(repeated_years)}")
+    
+    partial = new_rows.groupby(['country', 'year'], dropna=False)[FIRE_COLUMNS].sum()
+    cube = FireCube.from_country_year(merge_country_year(country_year, partial))
+    save_fire_state(cube, state_path)
+    
+    print(f"Added {len(new_rows):,} rows for years {sorted(new_years)}")
+    return cube
+
+# --------------------------
+# Class: Fire Cube
+# --------------------------
+# This class holds burned area as a dense array indexed by country, year and land cover
+# type, with integer-coded country and year axes. It also keeps running totals along
+# the year axis, so any year range is summed with one subtraction. values has one
+# extra country row and one extra year column at the end, holding the rows whose
+# country or year is missing: they count towards the country, year and land cover
+# totals they still belong to, but never appear as a country or year of their own. Questions such as
+# "top 10 countries for savannas in 2015-2019" are answered from the arrays alone,
+# without another groupby over the raw data.
+class FireCube:
+    def __init__(self, countries, years, values):
+        self.countries = np.asarray(countries)
+        self.years = np.asarray(years)
+        self.land_covers = list(FIRE_COLUMNS)
+        self.values = values
+        self.country_codes = {country: i for i, country in enumerate(self.countries)}
+        
+        # year_totals[:, j] holds the sum over the first j years (year_totals[:, 0] is zero);
+        # year_totals[:, -1] also includes the rows with no year
+        self.year_totals = np.zeros((len(self.countries) + 1, len(self.years) + 2, len(self.land_covers)))
+        np.cumsum(values, axis=1, out=self.year_totals[:, 1:])
+
+    # Builds the cube from a table indexed by (country, year) with one column per land cover
+    # (missing keys go to the extra row and column)
+    @classmethod
+    def from_country_year(cls, country_year):
+        countries, country_codes = _codes_with_missing(country_year.index.get_level_values('country'), str)
+        years, year_codes = _codes_with_missing(country_year.index.get_level_values('year'), int)
+        
+        values = np.zeros((len(countries) + 1, len(years) + 1, len(FIRE_COLUMNS)))
+        np.add.at(values, (country_codes, year_codes), country_year[FIRE_COLUMNS].to_numpy())
+        return cls(countries, years, values)
+
+    # Converts the query arguments into array indexes. years may be one year or an
+    # inclusive (start, end) range; countries and land_covers may be one name or a list.
+    def _year_bounds(self, years):
+        if years is None:
+            return 0, len(self.years)
+        start, end = years if isinstance(years, tuple) else (years, years)
+        return (int(np.searchsorted(self.years, start, side='left')),
+                int(np.searchsorted(self.years, end, side='right')))
+
+    def _country_index(self, countries):
+        if countries is None:
+            return slice(None)
+        if isinstance(countries, str):
+            return [self.country_codes[countries]]
+        return [self.country_codes[country] for country in countries]
+
+    def _land_cover_index(self, land_covers):
+        if land_covers is None:
+            return slice(None)
+        if isinstance(land_covers, str):
+            return [self.land_covers.index(land_covers)]
+        return [self.land_covers.index(land_cover) for land_cover in land_covers]
+
+    # Burned area per country and land cover over a year range, as a 2-D array
+    def _range_totals(self, years=None):
+        start, end = self._year_bounds(years)
+        return self.year_totals[:-1, end] - self.year_totals[:-1, start]
+
+    # Total burned area per country for the chosen years and land cover types
+    def country_totals(self, years=None, land_covers=None):
+        totals = self._range_totals(years)[:, self._land_cover_index(land_covers)].sum(axis=1)
+        return pd.Series(totals, index=pd.Index(self.countries, name='country'), name='burned_area')
+
+    # The n countries with the largest burned area for the chosen years and land cover types
+    def top_n(self, n, years=None, land_covers=None):
+        totals = self._range_totals(years)[:, self._land_cover_index(land_covers)].sum(axis=1)
+        order = _top_indices(totals, n)
+        return pd.Series(totals[order], index=pd.Index(self.countries[order], name='country'),
+                         name='burned_area')
+
+    # Total burned area over any combination of countries, years and land cover types
+    def range_sum(self, countries=None, years=None, land_covers=None):
+        totals = self._range_totals(years)[self._country_index(countries)]
+        return float(totals[:, self._land_cover_index(land_covers)].sum())
+
+    # A sub-cube as a table indexed by (country, year) with one column per land cover
+    def slice(self, countries=None, years=None, land_covers=None):
+        start, end = self._year_bounds(years)
+        country_index = self._country_index(countries)
+        land_cover_index = self._land_cover_index(land_covers)
+        
+        values = self.values[:-1][country_index, start:end][:, :, land_cover_index]
+        index = pd.MultiIndex.from_product([self.countries[country_index], self.years[start:end]],
+                                           names=['country', 'year'])
+        columns = np.array(self.land_covers)[land_cover_index]
+        return pd.DataFrame(values.reshape(-1, len(columns)), index=index, columns=columns)
+
+    # The stored (non-empty) country×year rows, used as the persisted state; rows with
+    # a missing country or year have a blank key
+    def country_year_frame(self):
+        index = pd.MultiIndex.from_product([pd.Index([*self.countries, None], dtype=object),
+                                            pd.array([*self.years, None], dtype='Int16')],
+                                           names=['country', 'year'])
+        frame = pd.DataFrame(self.values.reshape(-1, len(self.land_covers)), index=index,
+                             columns=self.land_covers)
+        return frame[(frame.to_numpy() != 0).any(axis=1)]
+
+    # Burned area by country for each land cover type, plus the total
+    def country_summary(self):
+        country_totals = pd.DataFrame(self.year_totals[:-1, -1], columns=self.land_covers,
+                                      index=pd.Index(self.countries, name='country'))
+        country_totals['total_burned_area'] = country_totals.sum(axis=1)
+        return country_totals
+
+    # Burned area by year for each land cover type, plus the total
+    def yearly_summary(self):
+        yearly_totals = pd.DataFrame(self.values[:, :-1].sum(axis=0), columns=self.land_covers,
+                                     index=pd.Index(self.years, name='year'))
+        yearly_totals['total_burned_area'] = yearly_totals.sum(axis=1)
+        return yearly_totals
+
+    # Global burned area for each land cover type
+    def land_cover_totals(self):
+        return pd.Series(self.year_totals[:, -1].sum(axis=0), index=self.land_covers)
+
+# Returns the sorted distinct labels that are not missing, and the position of each
+# label among them (missing labels get the position after the last one)
+def _codes_with_missing(labels, dtype):
+    missing = np.asarray(labels.isna())
+    distinct, codes = np.unique(np.asarray(labels[~missing], dtype=dtype), return_inverse=True)
+    all_codes = np.full(len(labels), len(distinct))
+    all_codes[~missing] = codes
+    return distinct, all_codes
+
+# --------------------------
+# Function: Top Indices
+# --------------------------
+# This function returns the positions of the n largest values, largest first, with
+# ties kept in their original order. It partitions the array instead of sorting it
+# all, so the cost grows with n log n (plus any values tied at the cut-off) rather
+# than with the full length.
+def _top_indices(values, n):
+    n = max(0, min(n, len(values)))
+    if n == 0:
+        return np.array([], dtype=int)
+    negated = -values
+    if n < len(values):
+        # Keep every value tied with the n-th largest, so the stable order below decides
+        # which of them make the cut, exactly as a full stable sort would
+        kth = np.partition(negated, n - 1)[n - 1]
+        candidates = np.flatnonzero(~(negated > kth))
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.lexsort((candidates, negated[candidates]))][:n]
+
 # --------------------------
 # Function: Create Country Fire Summary
 # --------------------------
-# This function aggregates burned area data by country for different land cover types.
-# It calculates total burned area per country and sorts them in descending order.
-def create_country_fire_summary(df):
+# This function returns the burned area by country for different land cover types,
+# with the total burned area per country, sorted in descending order. With top_n it
+# only selects and orders the top_n countries (same order as the full sort) instead
+# of sorting every country; leave top_n as None to get the full ordering.
+def create_country_fire_summary(cube, top_n=None):
     """
     Create summary statistics by country
     """
-    fire_columns = ['forest', 'savannas', 'shrublands_grasslands', 'croplands', 'other']
-    country_summary = df.groupby('country')[fire_columns].sum()
-    country_summary['total_burned_area'] = country_summary.sum(axis=1)
-    country_summary = country_summary.sort_values('total_burned_area', ascending=False)
-    return country_summary
+    country_summary = cube.country_summary()
+    if top_n is None:
+        return country_summary.sort_values('total_burned_area', ascending=False, kind='stable')
+    return country_summary.iloc[_top_indices(country_summary['total_burned_area'].to_numpy(), top_n)]
 
 # --------------------------
 # Function: Create Yearly Trend Analysis
 # --------------------------
-# This function groups the data by year to show the trend of burned areas over time
+# This function returns the trend of burned areas over time
 # for each land cover type and overall totals.
-def create_yearly_trend_analysis(df):
+def create_yearly_trend_analysis(cube):
     """
     Analyze fire trends over years
     """
-    fire_columns = ['forest', 'savannas', 'shrublands_grasslands', 'croplands', 'other']
-    
-    yearly_summary = df.groupby('year')[fire_columns].sum()
-    yearly_summary['total_burned_area'] = yearly_summary.sum(axis=1)
+    yearly_summary = cube.yearly_summary()
     
     return yearly_summary
 
 # --------------------------
 # Function: Create Land Cover Analysis
 # --------------------------
-# This function calculates the total burned area for each land cover type globally.
-def create_land_cover_analysis(df):
+# This function returns the total burned area for each land cover type globally.
+def create_land_cover_analysis(cube):
     """
     Analyze fire distribution across different land cover types
     """
-    fire_columns = ['forest', 'savannas', 'shrublands_grasslands', 'croplands', 'other']
-    
-    land_cover_totals = df[fire_columns].sum()
+    land_cover_totals = cube.land_cover_totals()
     
     return land_cover_totals
 
@@ -95,10 +627,12 @@ def create_land_cover_analysis(df):
 # --------------------------
 # This function creates a bar chart showing the top countries with the highest burned area.
 # It also annotates each bar with its value and saves the chart as a PNG file.
-def plot_top_countries_burned_area(country_summary, top_n=20):
+def plot_top_countries_burned_area(country_summary, top_n=20, output_dir='.', dpi=300, fmt='png', show=True):
     """
     Plot top countries by total burned area
     """
+    import matplotlib.pyplot as plt
+    
     plt.figure(figsize=(15, 8))
     
     top_countries = country_summary.head(top_n)
@@ -116,24 +650,23 @@ def plot_top_countries_burned_area(country_summary, top_n=20):
                 ha='center', va='bottom', fontsize=8)
     
     plt.tight_layout()
-    plt.savefig('top_countries_burned_area.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    return _save_chart('top_countries_burned_area', output_dir, dpi, fmt, show)
 
 # --------------------------
 # Function: Create Regional Heatmap
 # --------------------------
 # This function generates a heatmap showing fire activity by country and land cover type
-# for the top N countries by total burned area.
-def create_regional_heatmap(df, top_n=30):
+# for the top N countries by total burned area, reusing the ranked country summary.
+def create_regional_heatmap(country_summary, top_n=30, output_dir='.', dpi=300, fmt='png', show=True):
     """
     Create a heatmap showing fire activity by region and land cover type
     """
-    fire_columns = ['forest', 'savannas', 'shrublands_grasslands', 'croplands', 'other']
-    country_totals = df.groupby('country')[fire_columns].sum()
-    country_totals['total'] = country_totals.sum(axis=1)
-    top_countries = country_totals.nlargest(top_n, 'total')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    top_countries = country_summary.head(top_n)
     
-    heatmap_data = top_countries[fire_columns]
+    heatmap_data = top_countries[FIRE_COLUMNS]
     
     plt.figure(figsize=(12, 16))
     
@@ -147,47 +680,43 @@ def create_regional_heatmap(df, top_n=30):
     plt.xlabel('Land Cover Type')
     plt.ylabel('Country')
     plt.tight_layout()
-    plt.savefig('regional_fire_heatmap.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    return _save_chart('regional_fire_heatmap', output_dir, dpi, fmt, show)
 
 # --------------------------
 # Function: Create World Fire Map Simulation
 # --------------------------
-# This function simulates a world map by arranging the top 50 countries in a grid.
-# The circle size and color represent burned area intensity.
-def create_world_fire_map_simulation(country_summary):
-    plt.figure(figsize=(16, 10))
-    
-    top_50_countries = country_summary.head(50)
+# This function simulates a world map by arranging the top countries in a grid of n_cols
+# columns. The circle size and color represent burned area intensity. Positions, sizes
+# and colors are computed with array operations, so the map scales to many regions;
+# labels are skipped when there are more than max_labels of them.
+def create_world_fire_map_simulation(country_summary, top_n=50, n_cols=10, max_labels=200,
+                                     output_dir='.', dpi=300, fmt='png', show=True):
+    import matplotlib.pyplot as plt
     
-    n_cols = 10
-    n_rows = int(np.ceil(len(top_50_countries) / n_cols))
+    plt.figure(figsize=(16, 10))
     
-    x_positions = []
-    y_positions = []
-    sizes = []
+    top_countries = country_summary.head(top_n)
+    totals = top_countries['total_burned_area'].to_numpy()
     
-    for i, (country, data) in enumerate(top_50_countries.iterrows()):
-        row = i // n_cols
-        col = i % n_cols
-        
-        x_positions.append(col)
-        y_positions.append(n_rows - row)
-        
-        size = max(50, min(1000, data['total_burned_area'] / 1000))
-        sizes.append(size)
+    n_rows = int(np.ceil(len(totals) / n_cols))
+    rows, cols = np.divmod(np.arange(len(totals)), n_cols)
+    x_positions = cols
+    y_positions = n_rows - rows
+    sizes = np.clip(totals / 1000, 50, 1000)
     
     scatter = plt.scatter(x_positions, y_positions, 
                          s=sizes, 
-                         c=[country_summary.loc[country, 'total_burned_area'] for country in top_50_countries.index],
+                         c=totals,
                          cmap='YlOrRd',
                          alpha=0.7,
                          edgecolors='black',
                          linewidth=0.5)
     
-    for i, country in enumerate(top_50_countries.index):
-        plt.annotate(country[:3], 
-                    (x_positions[i], y_positions[i]),
+    if len(totals) <= max_labels:
+        ax = plt.gca()
+        labels = top_countries.index.astype(str).str[:3]
+        for x, y, label in zip(x_positions, y_positions, labels):
+            ax.text(x, y, label,
                     ha='center', va='center',
                     fontsize=8,
                     fontweight='bold')
@@ -201,73 +730,466 @@ def create_world_fire_map_simulation(country_summary):
     plt.yticks([])
     
     plt.tight_layout()
-    plt.savefig('world_fire_map_simulation.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    return _save_chart('world_fire_map_simulation', output_dir, dpi, fmt, show)
 
 # --------------------------
-# Main Function
+# Function: Save Chart
 # --------------------------
-# This is the entry point of the program. It:
-# - Loads the dataset
-# - Creates summaries and analyses
-# - Generates all visualizations
-# - Prints final summary statistics
-# - Handles errors gracefully
-def main():
-    csv_file_path = 'MCD64A1_burned_area_full_dataset_2002-2023.csv'
+# This function writes the current figure to the output directory and then either
+# shows it interactively or closes it, so headless runs never block.
+def _save_chart(name, output_dir, dpi, fmt, show):
+    import matplotlib.pyplot as plt
     
-    try:
-        df = load_and_process_fire_data(csv_file_path)
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f'{name}.{fmt}')
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
+    if show:
+        plt.show()
+    else:
+        plt.close()
+    return output_path
+
+# --------------------------
+# Function: Render Charts
+# --------------------------
+# This function renders the three charts at the same time, one per worker process,
+# on the non-interactive Agg backend. It returns once every file has been written.
+def render_charts(country_summary, output_dir='.', dpi=300, fmt='png', workers=3):
+    """
+    Render all charts headlessly and in parallel, returning the written file paths
+    """
+    charts = [plot_top_countries_burned_area, create_regional_heatmap, create_world_fire_map_simulation]
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_use_headless_backend) as pool:
+        futures = [pool.submit(chart, country_summary, output_dir=output_dir, dpi=dpi, fmt=fmt, show=False)
+                   for chart in charts]
+        return [future.result() for future in futures]
+
+def _use_headless_backend():
+    _stop_memory_tracing()
+    import matplotlib
+    matplotlib.use('Agg')
+
+# Pool initializer: a forked worker inherits tracemalloc from a profiled stage in the
+# parent, and tracing every allocation would slow the worker down several times over
+def _stop_memory_tracing():
+    tracemalloc.stop()
+
+# --------------------------
+# Class: Stage Profiler
+# --------------------------
+# This class records wall time, CPU time, peak memory and row counts for each stage of
+# the pipeline. CPU time and peak memory cover this process only, not pool workers
+# (which stop tracing as they start). Peak memory comes from tracemalloc (Python and
+# numpy allocations) and is only collected when trace_memory is on, because tracing
+# slows allocation down.
+# An optional hook is called with each stage record as soon as the stage finishes.
+class StageProfiler:
+    def __init__(self, hook=None, trace_memory=True):
+        self.hook = hook
+        self.trace_memory = trace_memory
+        self.stages = []
+
+    # Times the code inside the with-block; set record['rows'] to report a row count
+    @contextmanager
+    def stage(self, name):
+        record = {'stage': name, 'rows': None}
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
         
-        print("\nCreating country summary...")
-        country_summary = create_country_fire_summary(df)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall_start
+            record['cpu_seconds'] = time.process_time() - cpu_start
+            record['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+            if started_tracing:
+                tracemalloc.stop()
+            self.stages.append(record)
+            if self.hook is not None:
+                self.hook(record)
+
+    # Returns all stage records plus totals as a JSON-serializable dictionary
+    def report(self):
+        return {
+            'stages': self.stages,
+            'total_wall_seconds': sum(record['wall_seconds'] for record in self.stages),
+            'total_cpu_seconds': sum(record['cpu_seconds'] for record in self.stages),
+            'note': "cpu_seconds and peak_memory_bytes cover the main process only, not pool workers",
+        }
+
+    # Writes the report to a JSON file
+    def save_report(self, report_path):
+        with open(report_path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+# --------------------------
+# Class: Result Cache
+# --------------------------
+# This class stores finished pipeline results (summary tables and chart files) in one
+# directory per key. Keys come from result_cache_key, so the same input file with the
+# same parameters is never processed twice. Each hit refreshes the entry's timestamp,
+# and when the cache grows past max_bytes the least recently used entries are deleted.
+class ResultCache:
+    def __init__(self, cache_dir, max_bytes=500_000_000):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # Returns (summary tables, chart paths) for a key, or None on a miss
+    def get(self, key):
+        entry_dir = os.path.join(self.cache_dir, key)
+        meta_path = os.path.join(entry_dir, 'meta.json')
+        if not os.path.exists(meta_path):
+            return None
+        
+        with open(meta_path) as f:
+            meta = json.load(f)
+        os.utime(meta_path)
+        
+        tables = {name: pd.read_pickle(os.path.join(entry_dir, f'{name}.pkl')) for name in meta['tables']}
+        charts = [os.path.join(entry_dir, chart) for chart in meta['charts']]
+        return tables, charts
+
+    # Stores summary tables and copies of the chart files under a key
+    def put(self, key, tables, chart_paths):
+        entry_dir = os.path.join(self.cache_dir, key)
+        os.makedirs(entry_dir, exist_ok=True)
         
-        print("Creating yearly trend analysis...")
-        yearly_summary = create_yearly_trend_analysis(df)
+        for name, table in tables.items():
+            pd.to_pickle(table, os.path.join(entry_dir, f'{name}.pkl'))
+        for chart_path in chart_paths:
+            shutil.copy(chart_path, entry_dir)
         
-        print("Creating land cover analysis...")
-        land_cover_totals = create_land_cover_analysis(df)
+        # The metadata is written last so a half-written entry is never served
+        with open(os.path.join(entry_dir, 'meta.json'), 'w') as f:
+            json.dump({'tables': list(tables), 'charts': [os.path.basename(p) for p in chart_paths]}, f)
+        
+        self._evict()
+
+    # Deletes least recently used entries until the cache fits within max_bytes
+    def _evict(self):
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, key)
+            meta_path = os.path.join(entry_dir, 'meta.json')
+            if os.path.exists(meta_path):
+                size = sum(entry.stat().st_size for entry in os.scandir(entry_dir))
+                entries.append((os.path.getmtime(meta_path), size, entry_dir))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+
+# Bump when the cached results change shape or content, so older entries are no longer served
+RESULT_CACHE_VERSION = 3
+
+# --------------------------
+# Function: Result Cache Key
+# --------------------------
+# This function derives the cache key from the SHA-256 of the input file's content
+# plus every parameter that changes the output, so renaming or touching the file
+# does not invalidate the cache but editing it does.
+def result_cache_key(csv_file_path, **parameters):
+    """
+    Build a content-addressed key for a pipeline run
+    """
+    content_hash = _file_fingerprint(csv_file_path, content_hash=True)['sha256']
+    key_source = json.dumps({'input': content_hash, 'parameters': parameters}, sort_keys=True)
+    return hashlib.sha256(key_source.encode()).hexdigest()
+
+# --------------------------
+# Function: Build Fire Summary
+# --------------------------
+# This function collects the figures printed in the final report (countries, years,
+# global total, top countries and land cover shares) into a plain dictionary, so
+# the same data can be printed as text or written as JSON. country_summary only
+# needs its top rows, since the global total comes from the land cover totals.
+def build_fire_summary(country_summary, yearly_summary, land_cover_totals, countries_analyzed, top_n=10):
+    """
+    Collect the headline statistics of the fire analysis
+    """
+    land_cover_total = land_cover_totals.sum()
+    return {
+        'countries_analyzed': int(countries_analyzed),
+        'first_year': int(yearly_summary.index.min()),
+        'last_year': int(yearly_summary.index.max()),
+        'total_burned_area': float(land_cover_total),
+        'top_countries': [{'country': str(country), 'total_burned_area': float(area)}
+                          for country, area in country_summary['total_burned_area'].head(top_n).items()],
+        'land_cover': [{'land_cover': land_type, 'burned_area': float(area),
+                        'percentage': float(area / land_cover_total * 100)}
+                       for land_type, area in land_cover_totals.sort_values(ascending=False).items()],
+    }
+
+# --------------------------
+# Function: Print Fire Summary
+# --------------------------
+# This function prints the summary dictionary as the human-readable report.
+def print_fire_summary(summary):
+    print("\n" + "="*50)
+    print("FIRE DATA ANALYSIS SUMMARY")
+    print("="*50)
+    print(f"Total countries analyzed: {summary['countries_analyzed']}")
+    print(f"Years covered: {summary['first_year']} - {summary['last_year']}")
+    print(f"Total global burned area: {summary['total_burned_area']:,.0f} km²")
+    
+    print(f"\nTop {len(summary['top_countries'])} Countries by Total Burned Area:")
+    for i, entry in enumerate(summary['top_countries'], 1):
+        print(f"{i:2d}. {entry['country']}: {entry['total_burned_area']:,.0f} km²")
+    
+    print(f"\nBurned Area by Land Cover Type:")
+    for entry in summary['land_cover']:
+        print(f"  {entry['land_cover']}: {entry['burned_area']:,.0f} km² ({entry['percentage']:.1f}%)")
+
+# --------------------------
+# Function: Run Fire Pipeline
+# --------------------------
+# This function runs every stage of the analysis (load, aggregate, summaries and,
+# unless summary_only is set, the charts) and returns the summary tables together
+# with the paths of the chart files it wrote. Countries are only ranked as deep as
+# the deepest chart or report needs (ranking_depth), not sorted in full. With a
+# backend other than pandas, the CSV is read and grouped by that engine directly. With
+# use_cache (or a cache_dir), the pandas backend loads through the columnar .npy cache.
+# aggregation='stream' folds the CSV in chunks of chunksize rows instead of loading it,
+# and aggregation='parallel' splits it across worker processes.
+# With a state_path, the cube comes from the saved country×year state instead of the CSV
+# (the state is created from the CSV on the first run), and with append_csv_path the new
+# rows are first added to that state.
+def run_fire_pipeline(csv_file_path, profiler, summary_only=False, headless=False,
+                      output_dir='.', dpi=300, fmt='png', ranking_depth=50, backend='pandas',
+                      use_cache=False, cache_dir=None, aggregation='load', workers=None,
+                      chunksize=1_000_000, state_path=None, append_csv_path=None):
+    if append_csv_path:
+        if not state_path:
+            raise ValueError("Appending new data needs a saved state file.")
+        with profiler.stage('append_fire_year') as stage:
+            cube = append_fire_year(state_path, append_csv_path)
+            stage['rows'] = len(cube.countries) * len(cube.years)
+    elif state_path and os.path.exists(state_path):
+        print(f"Loading saved state from {state_path}...")
+        with profiler.stage('load_fire_state') as stage:
+            cube = load_fire_state(state_path)
+            stage['rows'] = len(cube.countries) * len(cube.years)
+    elif aggregation == 'stream':
+        with profiler.stage('stream_fire_aggregates') as stage:
+            cube = stream_fire_aggregates(csv_file_path, chunksize)
+            stage['rows'] = len(cube.countries) * len(cube.years)
+    elif aggregation == 'parallel':
+        with profiler.stage('parallel_fire_aggregates') as stage:
+            cube = parallel_fire_aggregates(csv_file_path, workers)
+            stage['rows'] = len(cube.countries) * len(cube.years)
+    elif backend == 'pandas':
+        with profiler.stage('load_and_process_fire_data') as stage:
+            df = load_and_process_fire_data(csv_file_path, use_cache=use_cache or bool(cache_dir),
+                                            cache_dir=cache_dir)
+            stage['rows'] = len(df)
         
-        print("\nGenerating visualizations...")
+        print("\nAggregating fire data...")
+        with profiler.stage('aggregate_fire_data') as stage:
+            cube = aggregate_fire_data(df)
+            stage['rows'] = len(cube.countries) * len(cube.years)
+    else:
+        print(f"Aggregating fire data with backend '{backend}'...")
+        with profiler.stage('aggregate_fire_csv') as stage:
+            cube = aggregate_fire_csv(csv_file_path, backend)
+            stage['rows'] = len(cube.countries) * len(cube.years)
+    
+    if state_path and not os.path.exists(state_path):
+        save_fire_state(cube, state_path)
+        print(f"Saved state to {state_path}")
+    
+    print("Creating country summary...")
+    with profiler.stage('create_country_fire_summary') as stage:
+        country_summary = create_country_fire_summary(cube, top_n=ranking_depth)
+        stage['rows'] = len(country_summary)
+    
+    print("Creating yearly trend analysis...")
+    with profiler.stage('create_yearly_trend_analysis') as stage:
+        yearly_summary = create_yearly_trend_analysis(cube)
+        stage['rows'] = len(yearly_summary)
+    
+    print("Creating land cover analysis...")
+    with profiler.stage('create_land_cover_analysis') as stage:
+        land_cover_totals = create_land_cover_analysis(cube)
+        stage['rows'] = len(land_cover_totals)
+    
+    tables = {
+        'country_summary': country_summary,
+        'yearly_summary': yearly_summary,
+        'land_cover_totals': land_cover_totals,
+        'countries_analyzed': len(cube.countries),
+    }
+    if summary_only:
+        return tables, []
+    
+    print("\nGenerating visualizations...")
+    
+    if headless:
+        print("Rendering all charts in parallel...")
+        with profiler.stage('render_charts') as stage:
+            chart_paths = render_charts(country_summary, output_dir, dpi, fmt)
+            stage['rows'] = len(country_summary)
+    else:
+        chart_paths = []
         
         print("1. Top countries by burned area...")
-        plot_top_countries_burned_area(country_summary)
+        with profiler.stage('plot_top_countries_burned_area') as stage:
+            chart_paths.append(plot_top_countries_burned_area(country_summary, output_dir=output_dir,
+                                                              dpi=dpi, fmt=fmt))
+            stage['rows'] = len(country_summary)
         
         print("2. Regional heatmap...")
-        create_regional_heatmap(df)
+        with profiler.stage('create_regional_heatmap') as stage:
+            chart_paths.append(create_regional_heatmap(country_summary, output_dir=output_dir,
+                                                       dpi=dpi, fmt=fmt))
+            stage['rows'] = len(country_summary)
         
         print("3. World fire map simulation...")
-        create_world_fire_map_simulation(country_summary)
-        
-        print("\n" + "="*50)
-        print("FIRE DATA ANALYSIS SUMMARY")
-        print("="*50)
-        print(f"Total countries analyzed: {df['country'].nunique()}")
-        print(f"Years covered: {df['year'].min()} - {df['year'].max()}")
-        print(f"Total global burned area: {country_summary['total_burned_area'].sum():,.0f} km²")
+        with profiler.stage('create_world_fire_map_simulation') as stage:
+            chart_paths.append(create_world_fire_map_simulation(country_summary, output_dir=output_dir,
+                                                                dpi=dpi, fmt=fmt))
+            stage['rows'] = len(country_summary)
+    
+    return tables, chart_paths
+
+# --------------------------
+# Main Function
+# --------------------------
+# This is the entry point of the program. It:
+# - Serves the whole result from the result cache when the same file was already
+#   analyzed with the same parameters (only with result_cache_dir)
+# - Otherwise runs the pipeline: load, aggregate once, summarize and draw the charts
+#   (interactively, or headless and in parallel), unless only the summary is wanted
+# - With state_path, keeps a saved country×year state and reports from it, adding
+#   the rows of append_csv_path first
+# - Prints final summary statistics as text, or as JSON on stdout
+# - Records per-stage timings (saved as JSON with profile_path, streamed to profile_hook)
+# - Reports errors on stderr and returns the exit status (0 on success, 1 on failure)
+def main(csv_file_path='MCD64A1_burned_area_full_dataset_2002-2023.csv', summary_only=False,
+         summary_format='text', headless=False, output_dir='.', dpi=300, fmt='png',
+         profile_path=None, profile_hook=None, result_cache_dir=None, max_cache_bytes=500_000_000,
+         backend='pandas', use_cache=False, cache_dir=None, aggregation='load', workers=None,
+         chunksize=1_000_000, state_path=None, append_csv_path=None):
+    profiler = StageProfiler(profile_hook, trace_memory=bool(profile_path or profile_hook))
+    
+    # In JSON mode stdout carries only the summary, so progress messages go to stderr
+    progress = redirect_stdout(sys.stderr) if summary_format == 'json' else nullcontext()
+    
+    try:
+        with progress:
+            # The result cache is keyed on the CSV, which a saved state no longer follows
+            if state_path:
+                result_cache_dir = None
+            
+            # The lookup is profiled as 'result_cache_lookup'; on a hit the same stage,
+            # including copying the charts out, is reported as 'result_cache_hit'
+            cached = None
+            if result_cache_dir:
+                with profiler.stage('result_cache_lookup') as stage:
+                    cache = ResultCache(result_cache_dir, max_cache_bytes)
+                    cache_key = result_cache_key(csv_file_path, version=RESULT_CACHE_VERSION,
+                                                 charts=not summary_only, dpi=dpi, fmt=fmt)
+                    cached = cache.get(cache_key)
+                    if cached:
+                        stage['stage'] = 'result_cache_hit'
+                        print("Using cached results...")
+                        tables, cached_charts = cached
+                        if cached_charts:
+                            os.makedirs(output_dir, exist_ok=True)
+                        for chart_path in cached_charts:
+                            shutil.copy(chart_path, output_dir)
+                        stage['rows'] = len(tables['country_summary'])
+            
+            if not cached:
+                tables, chart_paths = run_fire_pipeline(csv_file_path, profiler, summary_only, headless,
+                                                        output_dir, dpi, fmt, backend=backend,
+                                                        use_cache=use_cache, cache_dir=cache_dir,
+                                                        aggregation=aggregation, workers=workers,
+                                                        chunksize=chunksize, state_path=state_path,
+                                                        append_csv_path=append_csv_path)
+                if result_cache_dir:
+                    cache.put(cache_key, tables, chart_paths)
         
-        print(f"\nTop 10 Countries by Total Burned Area:")
-        for i, (country, data) in enumerate(country_summary.head(10).iterrows(), 1):
-            print(f"{i:2d}. {country}: {data['total_burned_area']:,.0f} km²")
+        summary = build_fire_summary(tables['country_summary'], tables['yearly_summary'],
+                                     tables['land_cover_totals'], tables['countries_analyzed'])
+        if summary_format == 'json':
+            print(json.dumps(summary, indent=2))
+        else:
+            print_fire_summary(summary)
         
-        print(f"\nBurned Area by Land Cover Type:")
-        for land_type, area in land_cover_totals.sort_values(ascending=False).items():
-            percentage = (area / land_cover_totals.sum()) * 100
-            print(f"  {land_type}: {area:,.0f} km² ({percentage:.1f}%)")
+        if not summary_only and summary_format != 'json':
+            print(f"\nAll visualizations have been saved as PNG files!")
+            print("Files created:")
+            print("- top_countries_burned_area.png")
+            print("- land_cover_distribution.png") 
+            print("- yearly_fire_trends.png")
+            print("- regional_fire_heatmap.png")
+            print("- world_fire_map_simulation.png")
         
-        print(f"\nAll visualizations have been saved as PNG files!")
-        print("Files created:")
-        print("- top_countries_burned_area.png")
-        print("- land_cover_distribution.png") 
-        print("- yearly_fire_trends.png")
-        print("- regional_fire_heatmap.png")
-        print("- world_fire_map_simulation.png")
+        if profile_path:
+            profiler.save_report(profile_path)
+            with progress:
+                print(f"\nStage profile saved to {profile_path}")
         
-    except FileNotFoundError:
-        print(f"Error: Could not find the file '{csv_file_path}'")
-        print("Please make sure the CSV file is in the same directory as this script.")
+    except FileNotFoundError as e:
+        print(f"Error: Could not find the file '{e.filename or csv_file_path}'", file=sys.stderr)
+        print("Please make sure the CSV file is in the same directory as this script.", file=sys.stderr)
+        return 1
     except Exception as e:
-        print(f"An error occurred: {str(e)}")
+        print(f"An error occurred: {str(e)}", file=sys.stderr)
+        return 1
+    return 0
+
+# --------------------------
+# Function: Parse Command-Line Arguments
+# --------------------------
+# This function defines the command-line interface. --summary-only skips every chart,
+# so matplotlib and seaborn are never imported.
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze global burned area data (MCD64A1).")
+    parser.add_argument('csv_file_path', nargs='?', default='MCD64A1_burned_area_full_dataset_2002-2023.csv',
+                        help="path to the burned area CSV")
+    parser.add_argument('--summary-only', action='store_true', help="print the summary without drawing charts")
+    parser.add_argument('--format', dest='summary_format', choices=['text', 'json'], default='text',
+                        help="summary output format")
+    parser.add_argument('--headless', action='store_true', help="render charts in parallel without showing them")
+    parser.add_argument('--output-dir', default='.', help="directory for the chart files")
+    parser.add_argument('--dpi', type=int, default=300, help="chart resolution")
+    parser.add_argument('--chart-format', dest='fmt', default='png', help="chart file format (png, svg, pdf, ...)")
+    parser.add_argument('--profile', dest='profile_path', help="write a per-stage JSON profile to this file")
+    parser.add_argument('--backend', choices=['pandas', 'pyarrow', 'polars', 'auto'], default='pandas',
+                        help="dataframe engine for reading and grouping (falls back to pandas if not installed)")
+    parser.add_argument('--aggregation', choices=['load', 'stream', 'parallel'], default='load',
+                        help="load the whole CSV, stream it in chunks, or split it across worker processes")
+    parser.add_argument('--workers', type=int, help="worker processes for --aggregation parallel (default: all cores)")
+    parser.add_argument('--chunksize', type=int, default=1_000_000,
+                        help="rows per chunk for --aggregation stream")
+    parser.add_argument('--state', dest='state_path',
+                        help="country×year state file: created from the CSV if missing, otherwise used instead of it")
+    parser.add_argument('--append', dest='append_csv_path', metavar='NEW_CSV',
+                        help="add the rows of NEW_CSV (new years only) to the --state file, then report")
+    parser.add_argument('--cache', dest='use_cache', action='store_true',
+                        help="keep a columnar .npy copy of the CSV (in <csv>.cache/) for faster reloads")
+    parser.add_argument('--cache-dir', help="directory for the columnar cache (implies --cache)")
+    parser.add_argument('--result-cache', dest='result_cache_dir',
+                        help="reuse summaries and charts from this cache directory when the input is unchanged")
+    parser.add_argument('--result-cache-mb', type=int, default=500,
+                        help="size cap for the result cache; least recently used entries are evicted")
+    args = parser.parse_args(argv)
+    if args.append_csv_path and not args.state_path:
+        parser.error("--append requires --state")
+    args.max_cache_bytes = args.result_cache_mb * 1_000_000
+    del args.result_cache_mb
+    return args
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main(**vars(parse_args())))
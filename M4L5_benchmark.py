@@ -0,0 +1,203 @@
+"""
+M4L5_benchmark.py
+
+This Python script measures the performance of the fire data analysis in M4L5.py without
+needing the real MCD64A1 dataset.
+
+Key Features:
+-------------
+1. Generates synthetic CSV files with the same schema as the real dataset
+   (`country`, `year` and the five land cover columns), with configurable row,
+   country and year counts. Large files are written in chunks to keep memory bounded.
+2. Times every stage of the pipeline separately:
+   - load_and_process_fire_data
+   - aggregate_fire_data and each create_* summary
+   - each plot function (rendered headlessly, never shown)
+3. Measures how long `import M4L5` takes on its own (the summary-only path) and
+   together with the plotting stack it loads lazily.
+4. Writes the results as JSON so runs from different versions can be compared.
+
+Usage:
+------
+    python M4L5_benchmark.py                      # 10k, 1M and 10M rows
+    python M4L5_benchmark.py --sizes 10000 100000 --output results.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+import matplotlib
+# Render to files only; benchmarks must never open a window
+matplotlib.use('Agg')
+
+import M4L5
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+
+# --------------------------
+# Function: Generate Synthetic Fire Data
+# --------------------------
+# This function builds a dataframe shaped like the MCD64A1 extract: a country name,
+# a year and a burned area (km²) for each land cover type. Areas follow a skewed
+# gamma distribution so a few rows dominate, as they do in the real data.
+def generate_synthetic_fire_data(n_rows, n_countries=200, n_years=22, start_year=2002, seed=0):
+    """
+    Create a synthetic fire dataframe with the MCD64A1 schema
+    """
+    rng = np.random.default_rng(seed)
+    countries = np.array([f"Country {i:04d}" for i in range(n_countries)])
+
+    data = {
+        'country': countries[rng.integers(0, n_countries, n_rows)],
+        'year': rng.integers(start_year, start_year + n_years, n_rows),
+    }
+    for column in M4L5.FIRE_COLUMNS:
+        data[column] = rng.gamma(0.5, 200.0, n_rows).round(2)
+
+    return pd.DataFrame(data)
+
+# --------------------------
+# Function: Write Synthetic CSV
+# --------------------------
+# This function writes a synthetic dataset to disk in chunks, so even the 10M row
+# file never has to be held in memory at once. Existing files are reused.
+def write_synthetic_csv(path, n_rows, n_countries=200, n_years=22, chunk_rows=1_000_000, seed=0):
+    """
+    Write a synthetic fire CSV with n_rows rows, unless it already exists
+    """
+    if os.path.exists(path):
+        return path
+
+    partial_path = path + '.partial'
+    for i, start in enumerate(range(0, n_rows, chunk_rows)):
+        chunk = generate_synthetic_fire_data(min(chunk_rows, n_rows - start), n_countries,
+                                             n_years, seed=seed + i)
+        chunk.to_csv(partial_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    os.replace(partial_path, path)
+    return path
+
+# --------------------------
+# Function: Time Stage
+# --------------------------
+# This function runs one pipeline stage, hides its progress output, and records
+# how long it took.
+def time_stage(results, name, function, *args, **kwargs):
+    """
+    Run one stage and store its wall time in seconds under results[name]
+    """
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        value = function(*args, **kwargs)
+        results[name] = time.perf_counter() - start
+    return value
+
+# --------------------------
+# Function: Run Benchmark
+# --------------------------
+# This function times every stage of the M4L5 pipeline on one synthetic file.
+def run_benchmark(csv_file_path, output_dir, dpi=300):
+    """
+    Time each stage of the fire analysis on the given CSV
+    """
+    stages = {}
+
+    df = time_stage(stages, 'load_and_process_fire_data', M4L5.load_and_process_fire_data, csv_file_path)
+    cube = time_stage(stages, 'aggregate_fire_data', M4L5.aggregate_fire_data, df)
+    country_summary = time_stage(stages, 'create_country_fire_summary',
+                                 M4L5.create_country_fire_summary, cube)
+    time_stage(stages, 'create_yearly_trend_analysis', M4L5.create_yearly_trend_analysis, cube)
+    time_stage(stages, 'create_land_cover_analysis', M4L5.create_land_cover_analysis, cube)
+
+    chart_options = {'output_dir': output_dir, 'dpi': dpi, 'show': False}
+    time_stage(stages, 'plot_top_countries_burned_area',
+               M4L5.plot_top_countries_burned_area, country_summary, **chart_options)
+    time_stage(stages, 'create_regional_heatmap',
+               M4L5.create_regional_heatmap, country_summary, **chart_options)
+    time_stage(stages, 'create_world_fire_map_simulation',
+               M4L5.create_world_fire_map_simulation, country_summary, **chart_options)
+
+    return {'rows': len(df), 'stages': stages, 'total_seconds': sum(stages.values())}
+
+# --------------------------
+# Function: Measure Import Time
+# --------------------------
+# This function imports M4L5 in fresh interpreters, once alone and once together with
+# matplotlib and seaborn, and keeps the fastest of several runs of each. The difference
+# is the start-up cost that summary-only runs no longer pay.
+def measure_import_time(repeats=5):
+    """
+    Return the best-of-N import times for M4L5 with and without the plotting stack
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    statements = {
+        'summary_only': 'import M4L5',
+        'with_plotting': 'import M4L5, matplotlib.pyplot, seaborn',
+    }
+
+    timings = {}
+    for name, statement in statements.items():
+        code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        runs = [float(subprocess.run([sys.executable, '-c', code], cwd=script_dir, check=True,
+                                     capture_output=True, text=True).stdout)
+                for _ in range(repeats)]
+        timings[name] = min(runs)
+    return timings
+
+# --------------------------
+# Main Function
+# --------------------------
+# This is the entry point of the benchmark. It generates (or reuses) one synthetic
+# file per size, times every stage on each, and writes all results as JSON.
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the M4L5 fire analysis on synthetic data.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="row counts to benchmark")
+    parser.add_argument('--countries', type=int, default=200, help="number of distinct countries")
+    parser.add_argument('--years', type=int, default=22, help="number of distinct years")
+    parser.add_argument('--dpi', type=int, default=300, help="resolution of the rendered charts")
+    parser.add_argument('--data-dir', default='benchmark_data', help="where synthetic CSVs and charts go")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON results file")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    report = {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'countries': args.countries,
+        'years': args.years,
+        'dpi': args.dpi,
+        'runs': [],
+    }
+
+    print("Measuring import time...")
+    report['import_seconds'] = measure_import_time()
+    for name, seconds in report['import_seconds'].items():
+        print(f"  {name}: {seconds:.3f} s")
+
+    for n_rows in args.sizes:
+        csv_file_path = os.path.join(args.data_dir, f'synthetic_{n_rows}_{args.countries}_{args.years}.csv')
+        print(f"Preparing {n_rows:,} rows...")
+        write_synthetic_csv(csv_file_path, n_rows, args.countries, args.years)
+
+        print(f"Benchmarking {n_rows:,} rows...")
+        result = run_benchmark(csv_file_path, args.data_dir, args.dpi)
+        report['runs'].append(result)
+        for stage, seconds in result['stages'].items():
+            print(f"  {stage}: {seconds:.3f} s")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+    return report
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import M4L5
+
+# A small fire CSV with a blank country, a blank year and a row with both blank
+MISSING_KEYS_CSV = """country,year,forest,savannas,shrublands_grasslands,croplands,other
+A,2001,1,0,0,0,0
+B,2001,2,0,0,0,0
+,2001,4,0,0,0,0
+A,,8,0,0,0,0
+,,16,0,0,0,0
+B,2002,32,0,0,0,0
+"""
+
+
+def test_top_indices_matches_stable_sort_with_ties():
+    rng = np.random.default_rng(0)
+    for _ in range(2000):
+        values = rng.integers(0, 5, rng.integers(1, 60)).astype(float)
+        for n in (1, 3, 10, len(values)):
+            expected = np.argsort(-values, kind='stable')[:n]
+            np.testing.assert_array_equal(M4L5._top_indices(values, n), expected)
+
+
+def test_top_indices_mostly_zero():
+    values = np.zeros(42)
+    values[8] = 9
+    np.testing.assert_array_equal(M4L5._top_indices(values, 3), [8, 0, 1])
+
+
+def test_missing_keys_stay_in_totals(tmp_path):
+    csv_path = tmp_path / 'fires.csv'
+    csv_path.write_text(MISSING_KEYS_CSV)
+    cube = M4L5.aggregate_fire_data(M4L5.read_fire_csv(csv_path))
+
+    assert cube.land_cover_totals()['forest'] == 63
+    assert cube.country_summary()['forest'].to_dict() == {'A': 9, 'B': 34}
+    assert cube.yearly_summary()['forest'].to_dict() == {2001: 7, 2002: 32}
+
+    state_path = str(tmp_path / 'state.csv')
+    M4L5.save_fire_state(cube, state_path)
+    assert M4L5._cubes_match(cube, M4L5.load_fire_state(state_path))
+
+
+@pytest.mark.parametrize('backend', ['pyarrow', 'polars'])
+def test_backends_match_pandas_with_missing_keys(tmp_path, backend):
+    pytest.importorskip(backend)
+    csv_path = tmp_path / 'fires.csv'
+    csv_path.write_text(MISSING_KEYS_CSV)
+    assert M4L5.check_backend_aggregates(str(csv_path), backend)